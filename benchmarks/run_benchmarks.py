@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the generation, enrichment, aggregation, export and scrape-parsing hot paths
+
+    python benchmarks/run_benchmarks.py                      # 1e2 and 1e4 matches
+    python benchmarks/run_benchmarks.py --sizes 100 10000 1000000
+    python benchmarks/run_benchmarks.py --output new.json --compare old.json
+
+Each case reports wall time, throughput and peak traced memory; --output writes
+the results as JSON so runs on different commits can be compared with --compare.
+"""
+
+import argparse
+from contextlib import contextmanager, redirect_stdout
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import date, timedelta
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+SAMPLE_PAGES_DIR = os.path.join(BENCH_DIR, 'sample_pages')
+sys.path.insert(0, os.path.join(REPO_DIR, 'src'))
+
+from aggregation import TournamentAggregator  # noqa: E402
+from complete_tournament_with_cards_time import (  # noqa: E402
+    enrich_matches,
+    export_text_files,
+    generate_match_data_batch,
+)
+from excel_report import write_excel_report  # noqa: E402
+from incremental_export import ExportManifest  # noqa: E402
+from scraper import TournamentScraper, parse_tournament_page  # noqa: E402
+
+DEFAULT_SIZES = [100, 10000]
+
+STAGES = ['Group A', 'Group B', 'Group C', 'Group D', 'Quarter-final', 'Semi-final',
+          '3rd Place', 'Final']
+# Roughly the share of each stage in a 32-match tournament
+STAGE_WEIGHTS = [6, 6, 6, 6, 4, 2, 1, 1]
+
+
+# Synthetic data --------------------------------------------------------------
+
+def synthetic_fixtures(n_matches, seed=0):
+    """Raw fixture dicts shaped like src/fixtures/*.json"""
+    rng = random.Random(seed)
+    teams = [f'Team {i:03d}' for i in range(200)]
+    venues = [f'Stadium {i}, City {i // 3}' for i in range(60)]
+    start = date(2000, 1, 1)
+
+    fixtures = []
+    for i in range(n_matches):
+        home, away = rng.sample(teams, 2)
+        fixture = {
+            'date': (start + timedelta(days=i // 4)).isoformat(),
+            'time': rng.choice(['17:00', '20:00']),
+            'home_team': home,
+            'away_team': away,
+            'home_score': rng.choice([0, 0, 1, 1, 1, 2, 2, 3, 4]),
+            'away_score': rng.choice([0, 0, 1, 1, 1, 2, 2, 3]),
+            'stage': rng.choices(STAGES, STAGE_WEIGHTS)[0],
+            'venue': rng.choice(venues),
+            'attendance': rng.randrange(5000, 50000, 1000),
+        }
+        fixtures.append(fixture)
+    return fixtures
+
+
+def synthetic_tournaments(n_matches, seed=0):
+    """Enriched synthetic matches grouped like export_text_files expects"""
+    fixtures = synthetic_fixtures(n_matches, seed)
+    # Two large "tournaments" keep the per-tournament file count fixed across sizes
+    half = len(fixtures) // 2
+    tournaments = []
+    for index, chunk in enumerate([fixtures[:half], fixtures[half:]]):
+        entry = {'tournament': f'Synthetic {index}', 'id_prefix': f'SYNTHETIC_{index}'}
+        tournaments.append((entry, enrich_matches(chunk, entry['tournament'],
+                                                  entry['id_prefix'], 1, seed=seed)))
+    return tournaments
+
+
+# Local HTTP stand-in ------------------------------------------------------------
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=SAMPLE_PAGES_DIR, **kwargs)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def sample_page_server():
+    """Serve benchmarks/sample_pages on a random local port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def sample_pages():
+    names = sorted(n for n in os.listdir(SAMPLE_PAGES_DIR) if n.endswith('.html'))
+    pages = []
+    for name in names:
+        with open(os.path.join(SAMPLE_PAGES_DIR, name), 'rb') as f:
+            pages.append((name, f.read()))
+    return pages
+
+
+# Cases ------------------------------------------------------------------------
+# Each case takes a size and returns (setup, run, items): setup() builds inputs
+# outside the timed region and run(inputs) is the measured work.
+
+def case_generate(size):
+    def setup():
+        fixtures = synthetic_fixtures(size)
+        return {column: [f[column] for f in fixtures]
+                for column in ['home_score', 'away_score', 'stage']}
+    return setup, lambda columns: generate_match_data_batch(columns, rng=1), size
+
+
+def case_enrich(size):
+    def setup():
+        return synthetic_fixtures(size)
+    return setup, lambda fixtures: enrich_matches(fixtures, 'Synthetic', 'SYN', 1, seed=1), size
+
+
+def case_aggregate(size):
+    def setup():
+        return [m for _, matches in synthetic_tournaments(size) for m in matches]
+    return setup, lambda matches: TournamentAggregator().consume(matches).summary_rows(), size
+
+
+def case_export(size):
+    def setup():
+        tournaments = synthetic_tournaments(size)
+        matches = [m for _, ms in tournaments for m in ms]
+        return tournaments, TournamentAggregator().consume(matches).summary_rows()
+
+    def run(inputs):
+        tournaments, summary_stats = inputs
+        workdir = tempfile.mkdtemp(prefix='bench-export-')
+        cwd = os.getcwd()
+        try:
+            os.chdir(workdir)
+            os.makedirs('complete_enhanced_data')
+            manifest = ExportManifest('complete_enhanced_data', force=True)
+            hashes = {entry['tournament']: 'bench' for entry, _ in tournaments}
+            hashes['combined'] = 'bench'
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                export_text_files(tournaments, summary_stats, manifest, hashes)
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return setup, run, size
+
+
+def case_excel(size):
+    def setup():
+        return [m for _, matches in synthetic_tournaments(size) for m in matches]
+
+    def run(matches):
+        fd, path = tempfile.mkstemp(suffix='.xlsx')
+        os.close(fd)
+        try:
+            write_excel_report(path, iter(matches))
+        finally:
+            os.remove(path)
+
+    return setup, run, size
+
+
+def case_parse(size):
+    """Parse the saved sample pages; size is the number of page parses"""
+    pages = sample_pages()
+
+    def run(_):
+        rows = 0
+        for i in range(size):
+            rows += len(parse_tournament_page(pages[i % len(pages)][1]))
+        return rows
+
+    return (lambda: None), run, size
+
+
+def case_scrape(size):
+    """Fetch and parse sample pages over local HTTP; size is the number of requests"""
+    def run(base_url):
+        names = [name for name, _ in sample_pages()]
+        scraper = TournamentScraper(max_workers=8, per_host_limit=8)
+        urls = [f'{base_url}/{names[i % len(names)]}?page={i}' for i in range(size)]
+        return scraper.scrape_many(urls)
+
+    return None, run, size
+
+
+CASES = {
+    'generate': (case_generate, None),
+    'enrich': (case_enrich, None),
+    'aggregate': (case_aggregate, None),
+    'export_csv_json': (case_export, 100000),
+    'export_excel': (case_excel, 20000),
+    'parse_html': (case_parse, 1000),
+    'scrape_local_http': (case_scrape, 500),
+}
+
+
+# Runner -----------------------------------------------------------------------
+
+def measure(name, size, repeat, server_url):
+    factory, cap = CASES[name]
+    if cap is not None:
+        size = min(size, cap)
+    setup, run, items = factory(size)
+    inputs = setup() if setup is not None else server_url
+
+    # Untimed warm-up: lazy imports and first-call caches are not part of the case
+    run(inputs)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(inputs)
+        timings.append(time.perf_counter() - started)
+
+    # Separate traced run so tracemalloc overhead does not skew the timings
+    tracemalloc.start()
+    run(inputs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        'name': name,
+        'size': size,
+        'items': items,
+        'repeat': repeat,
+        'seconds_min': round(best, 6),
+        'seconds_median': round(statistics.median(timings), 6),
+        'throughput_per_s': round(items / best, 1) if best else None,
+        'peak_memory_bytes': peak,
+    }
+
+
+def machine_info():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {(r['name'], r['size']): r for r in json.load(f)['results']}
+
+    print(f"\n📊 Compared with {baseline_path}")
+    print(f"{'case':<20}{'size':>10}{'time ratio':>12}{'memory ratio':>14}")
+    for r in results:
+        old = baseline.get((r['name'], r['size']))
+        if not old:
+            continue
+        time_ratio = r['seconds_min'] / old['seconds_min'] if old['seconds_min'] else float('nan')
+        memory_ratio = (r['peak_memory_bytes'] / old['peak_memory_bytes']
+                        if old['peak_memory_bytes'] else float('nan'))
+        print(f"{r['name']:<20}{r['size']:>10}{time_ratio:>12.2f}{memory_ratio:>14.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='match counts to benchmark (e.g. 100 10000 1000000)')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write results as JSON to this path')
+    parser.add_argument('--compare', help='baseline JSON from an earlier --output run')
+    args = parser.parse_args(argv)
+
+    results = []
+    with sample_page_server() as server_url:
+        for name in args.cases:
+            seen = set()
+            for size in args.sizes:
+                cap = CASES[name][1]
+                effective = min(size, cap) if cap else size
+                if effective in seen:
+                    continue
+                seen.add(effective)
+                result = measure(name, size, args.repeat, server_url)
+                results.append(result)
+                print(f"{result['name']:<20}{result['size']:>10}  "
+                      f"{result['seconds_min']:>10.4f}s  {result['throughput_per_s']:>14,.0f}/s  "
+                      f"peak {result['peak_memory_bytes'] / 1e6:>9.1f} MB")
+
+    report = {'machine': machine_info(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📁 Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Single-pass aggregation over a stream of enhanced matches
+One pass produces the tournament summary statistics together with the
+MATCH_TIME_ANALYSIS and CARDS_ANALYSIS rows, in memory independent of match count.
+"""
+
+TIME_ANALYSIS_FIELDS = [
+    'match_id', 'tournament', 'date', 'stage', 'total_goals', 'total_cards',
+    'yellow_cards', 'red_cards', 'regular_time', 'stoppage_time_first_half',
+    'stoppage_time_second_half', 'total_stoppage_time', 'total_match_time',
+    'had_extra_time', 'extra_time_minutes'
+]
+
+CARDS_ANALYSIS_FIELDS = [
+    'match_id', 'tournament', 'date', 'stage', 'home_team', 'away_team', 'total_goals',
+    'yellow_cards', 'red_cards', 'total_cards', 'cards_per_goal', 'high_card_match',
+    'red_card_match'
+]
+
+SUMMARY_FIELDS = [
+    'tournament', 'total_matches', 'total_goals', 'avg_goals_per_match',
+    'total_yellow_cards', 'total_red_cards', 'total_cards', 'avg_cards_per_match',
+    'avg_match_time_minutes', 'total_attendance', 'avg_attendance',
+    'matches_with_extra_time', 'longest_match_minutes', 'shortest_match_minutes'
+]
+
+
+def time_analysis_row(match):
+    """MATCH_TIME_ANALYSIS row for one match"""
+    return {
+        'match_id': match['match_id'],
+        'tournament': match['tournament'],
+        'date': match['date'],
+        'stage': match['stage'],
+        'total_goals': match['total_goals'],
+        'total_cards': match['total_cards'],
+        'yellow_cards': match['yellow_cards'],
+        'red_cards': match['red_cards'],
+        'regular_time': 90,
+        'stoppage_time_first_half': match['stoppage_time_first_half'],
+        'stoppage_time_second_half': match['stoppage_time_second_half'],
+        'total_stoppage_time': match['total_stoppage_time'],
+        'total_match_time': match['total_match_time'],
+        'had_extra_time': match['had_extra_time'],
+        'extra_time_minutes': max(0, match['total_match_time'] - 95) if match['had_extra_time'] else 0
+    }
+
+
+def cards_analysis_row(match):
+    """CARDS_ANALYSIS row for one match"""
+    return {
+        'match_id': match['match_id'],
+        'tournament': match['tournament'],
+        'date': match['date'],
+        'stage': match['stage'],
+        'home_team': match['home_team'],
+        'away_team': match['away_team'],
+        'total_goals': match['total_goals'],
+        'yellow_cards': match['yellow_cards'],
+        'red_cards': match['red_cards'],
+        'total_cards': match['total_cards'],
+        'cards_per_goal': round(match['total_cards'] / max(1, match['total_goals']), 2),
+        'high_card_match': 'Yes' if match['total_cards'] >= 4 else 'No',
+        'red_card_match': 'Yes' if match['red_cards'] > 0 else 'No'
+    }
+
+
+class _Tally:
+    """Running totals for one tournament"""
+    __slots__ = ('matches', 'goals', 'yellow_cards', 'red_cards', 'cards', 'match_time',
+                 'attendance', 'extra_time', 'longest', 'shortest')
+
+    def __init__(self):
+        self.matches = self.goals = self.yellow_cards = self.red_cards = self.cards = 0
+        self.match_time = self.attendance = self.extra_time = 0
+        self.longest = None
+        self.shortest = None
+
+    def add(self, matches, goals, yellow_cards, red_cards, cards, match_time, attendance,
+            extra_time, longest, shortest):
+        self.matches += matches
+        self.goals += goals
+        self.yellow_cards += yellow_cards
+        self.red_cards += red_cards
+        self.cards += cards
+        self.match_time += match_time
+        self.attendance += attendance
+        self.extra_time += extra_time
+        self.longest = longest if self.longest is None else max(self.longest, longest)
+        self.shortest = shortest if self.shortest is None else min(self.shortest, shortest)
+
+
+class TournamentAggregator:
+    """
+    Accumulates summary statistics per tournament in one pass
+    time_sink / cards_sink are optional csv.DictWriter-like objects that receive
+    each MATCH_TIME_ANALYSIS / CARDS_ANALYSIS row as its match goes by
+    """
+
+    def __init__(self, time_sink=None, cards_sink=None):
+        self.time_sink = time_sink
+        self.cards_sink = cards_sink
+        self._tallies = {}
+
+    def _tally(self, tournament):
+        tally = self._tallies.get(tournament)
+        if tally is None:
+            tally = self._tallies[tournament] = _Tally()
+        return tally
+
+    def add(self, match):
+        """Fold one match dict into the running totals"""
+        match_time = match['total_match_time']
+        self._tally(match['tournament']).add(
+            1, match['total_goals'], match['yellow_cards'], match['red_cards'],
+            match['total_cards'], match_time, match['attendance'],
+            1 if match['had_extra_time'] else 0, match_time, match_time
+        )
+        if self.time_sink is not None:
+            self.time_sink.writerow(time_analysis_row(match))
+        if self.cards_sink is not None:
+            self.cards_sink.writerow(cards_analysis_row(match))
+
+    def consume(self, matches):
+        """Fold an iterable of match dicts; returns self for chaining"""
+        for match in matches:
+            self.add(match)
+        return self
+
+    def consume_frames(self, frames):
+        """Fold an iterable of DataFrame chunks using vectorized group totals"""
+        for frame in frames:
+            grouped = frame.groupby('tournament', sort=False, observed=True)
+            totals = grouped[['total_goals', 'yellow_cards', 'red_cards', 'total_cards',
+                              'total_match_time', 'attendance', 'had_extra_time']].sum()
+            longest = grouped['total_match_time'].max()
+            shortest = grouped['total_match_time'].min()
+            sizes = grouped.size()
+
+            for tournament, row in totals.iterrows():
+                self._tally(tournament).add(
+                    int(sizes[tournament]), int(row['total_goals']), int(row['yellow_cards']),
+                    int(row['red_cards']), int(row['total_cards']), int(row['total_match_time']),
+                    int(row['attendance']), int(row['had_extra_time']),
+                    int(longest[tournament]), int(shortest[tournament])
+                )
+
+            if self.time_sink is not None or self.cards_sink is not None:
+                for match in frame.to_dict('records'):
+                    if self.time_sink is not None:
+                        self.time_sink.writerow(time_analysis_row(match))
+                    if self.cards_sink is not None:
+                        self.cards_sink.writerow(cards_analysis_row(match))
+        return self
+
+    def summary_rows(self):
+        """TOURNAMENT_SUMMARY_STATISTICS rows, in the order tournaments were first seen"""
+        rows = []
+        for tournament, t in self._tallies.items():
+            rows.append({
+                'tournament': tournament,
+                'total_matches': t.matches,
+                'total_goals': t.goals,
+                'avg_goals_per_match': round(t.goals / t.matches, 2),
+                'total_yellow_cards': t.yellow_cards,
+                'total_red_cards': t.red_cards,
+                'total_cards': t.cards,
+                'avg_cards_per_match': round(t.cards / t.matches, 2),
+                'avg_match_time_minutes': round(t.match_time / t.matches, 1),
+                'total_attendance': t.attendance,
+                'avg_attendance': round(t.attendance / t.matches, 0),
+                'matches_with_extra_time': t.extra_time,
+                'longest_match_minutes': t.longest,
+                'shortest_match_minutes': t.shortest
+            })
+        return rows
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Command line entry point for the tournament tools
+
+    python cli.py scrape URL [URL ...]
+    python cli.py generate [--seed N] [TOURNAMENT ...]      # NDJSON on stdout
+    python cli.py export [--format csv|parquet|both|ndjson|xlsx] [--seed N] [TOURNAMENT ...]
+    python cli.py simulate TOURNAMENT [--runs N] [--seed N]
+    python cli.py stats [--data-dir DIR]
+    python cli.py startup-check [--budget-ms MS]
+
+Heavy dependencies (pandas, numpy, requests, bs4, ...) are imported inside the
+subcommand that needs them, so short invocations such as stats stay fast.
+Set METRICS_REPORT=report.json (or report.prom) to write timing and I/O metrics.
+"""
+import argparse
+import csv
+from datetime import datetime
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must not be loaded just to start the CLI
+HEAVY_MODULES = ('pandas', 'numpy', 'requests', 'bs4', 'lxml', 'pyarrow', 'openpyxl', 'selenium')
+
+DEFAULT_BUDGET_MS = 150
+
+
+def cmd_scrape(args):
+    from scraper import TournamentScraper
+
+    scraper = TournamentScraper(cache_dir=args.cache_dir)
+    os.makedirs('output', exist_ok=True)
+    for url, rows in zip(args.urls, scraper.scrape_many(args.urls)):
+        print(f"Scraped {len(rows)} rows from {url}")
+        if rows:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            scraper.save_data(rows, f"tournament_data_{timestamp}.csv")
+
+
+def cmd_generate(args):
+    import json
+    from streaming import iter_enriched_matches
+
+    out = sys.stdout
+    for match in iter_enriched_matches(args.tournaments or None, seed=args.seed):
+        out.write(json.dumps(match))
+        out.write('\n')
+
+
+def cmd_export(args):
+    from complete_tournament_with_cards_time import DEFAULT_SEED, export_complete_enhanced_data
+
+    seed = DEFAULT_SEED if args.seed is None else args.seed
+    export_complete_enhanced_data(seed=seed, output_format=args.format, force=args.force,
+                                  tournaments=args.tournaments or None)
+
+
+def cmd_simulate(args):
+    from complete_tournament_with_cards_time import load_tournament_matches
+    from simulator import simulate_tournament
+
+    matches = load_tournament_matches(args.tournament)
+    print(f"🏆 {args.tournament} - title odds ({args.runs:,} runs)")
+    for row in simulate_tournament(matches, n_runs=args.runs, seed=args.seed, workers=args.workers):
+        print(f"  {row['team']:<14} group {row['p_advance_group']:.1%}  "
+              f"final {row['p_final']:.1%}  title {row['p_champion']:.1%}")
+
+
+def cmd_stats(args):
+    """Print the exported summary statistics; stdlib csv only, no pandas"""
+    path = os.path.join(args.data_dir, 'TOURNAMENT_SUMMARY_STATISTICS.csv')
+    if not os.path.exists(path):
+        print(f"No summary statistics at {path} - run 'cli.py export' first")
+        return 1
+    with open(path, newline='', encoding='utf-8') as f:
+        for stat in csv.DictReader(f):
+            print(f"{stat['tournament']}:")
+            print(f"  📊 {stat['total_matches']} matches, {stat['total_goals']} goals "
+                  f"({stat['avg_goals_per_match']} avg)")
+            print(f"  🃏 {stat['total_cards']} cards ({stat['avg_cards_per_match']} avg) - "
+                  f"{stat['total_yellow_cards']} yellow, {stat['total_red_cards']} red")
+            print(f"  ⏱️  {stat['avg_match_time_minutes']} min avg match time")
+            print(f"  👥 {int(stat['total_attendance']):,} total attendance "
+                  f"({float(stat['avg_attendance']):,.0f} avg)")
+            print(f"  ⚡ {stat['matches_with_extra_time']} matches went to extra time")
+
+
+# Run in a fresh interpreter: import the CLI, build the parser, report what got loaded
+_STARTUP_PROBE = """
+import sys, time
+started = time.perf_counter()
+sys.path.insert(0, {src!r})
+import cli
+cli.build_parser()
+elapsed = time.perf_counter() - started
+print(elapsed, ' '.join(m for m in cli.HEAVY_MODULES if m in sys.modules))
+"""
+
+
+def cmd_startup_check(args):
+    """Fail when starting the CLI takes longer than the budget or loads heavy modules"""
+    probe = _STARTUP_PROBE.format(src=SRC_DIR)
+    totals, imports, loaded = [], [], set()
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                                check=True)
+        totals.append(time.perf_counter() - started)
+        elapsed, *modules = result.stdout.split()
+        imports.append(float(elapsed))
+        loaded.update(modules)
+
+    # Best of several runs filters out scheduler and disk-cache noise
+    total_ms, import_ms = min(totals) * 1000, min(imports) * 1000
+    print(f"⏱️  startup {total_ms:.1f} ms (CLI imports {import_ms:.1f} ms), "
+          f"budget {args.budget_ms:.0f} ms")
+    ok = True
+    if loaded:
+        print(f"❌ heavy modules loaded at startup: {', '.join(sorted(loaded))}")
+        ok = False
+    if total_ms > args.budget_ms:
+        print("❌ over budget")
+        ok = False
+    if ok:
+        print("✅ within budget")
+    return 0 if ok else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='cli.py', description="Women's tournament data tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help='scrape fixture pages to CSV files in output/')
+    scrape.add_argument('urls', nargs='+')
+    scrape.add_argument('--cache-dir', help='revalidate pages against this HTTP cache')
+    scrape.set_defaults(func=cmd_scrape)
+
+    generate = commands.add_parser('generate', help='write enriched matches as NDJSON to stdout')
+    generate.add_argument('tournaments', nargs='*', help='registry names (default: all)')
+    generate.add_argument('--seed', type=int)
+    generate.set_defaults(func=cmd_generate)
+
+    export = commands.add_parser('export', help='export the enhanced data files')
+    export.add_argument('tournaments', nargs='*', help='registry names (default: all)')
+    export.add_argument('--format', choices=['csv', 'parquet', 'both', 'ndjson', 'xlsx'], default='csv')
+    export.add_argument('--seed', type=int,
+                        help='seed for the generated data (default: a fixed seed, so re-exports '
+                             'of unchanged fixtures skip their files; another seed re-draws them)')
+    export.add_argument('--force', action='store_true', help='rewrite unchanged outputs too')
+    export.set_defaults(func=cmd_export)
+
+    simulate = commands.add_parser('simulate', help='Monte Carlo title odds for a tournament')
+    simulate.add_argument('tournament')
+    simulate.add_argument('--runs', type=int, default=100000)
+    simulate.add_argument('--seed', type=int)
+    simulate.add_argument('--workers', type=int)
+    simulate.set_defaults(func=cmd_simulate)
+
+    stats = commands.add_parser('stats', help='print the exported summary statistics')
+    stats.add_argument('--data-dir', default='complete_enhanced_data')
+    stats.set_defaults(func=cmd_stats)
+
+    check = commands.add_parser('startup-check', help='check CLI start-up time against a budget')
+    check.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    check.add_argument('--runs', type=int, default=5)
+    check.set_defaults(func=cmd_startup_check)
+    return parser
+
+
+def _check_tournaments(parser, args):
+    """Report unknown tournament names as a usage error (exit status 2), not a traceback"""
+    from tournament_registry import REGISTRY
+
+    names = list(getattr(args, 'tournaments', None) or [])
+    if getattr(args, 'tournament', None):
+        names.append(args.tournament)
+    for name in names:
+        try:
+            REGISTRY.get(name)
+        except KeyError as e:
+            parser.error(e.args[0])
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    report = os.environ.get('METRICS_REPORT')
+    if report:
+        import metrics
+        metrics.enable()
+    _check_tournaments(parser, args)
+    status = args.func(args)
+    if report:
+        metrics.write_report(report)
+    return status or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
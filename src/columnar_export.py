@@ -0,0 +1,116 @@
+"""
+Columnar (Parquet) export of the enhanced tournament data
+Writes one dataset partitioned by tournament with compact dtypes; the time and
+cards analysis tables are derived on load instead of being stored again.
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = ['venue', 'stage', 'day_of_week', 'match_week', 'time']
+TEAM_COLUMNS = ['home_team', 'away_team', 'winner']
+INT8_COLUMNS = [
+    'home_score', 'away_score', 'total_goals', 'yellow_cards', 'red_cards', 'total_cards',
+    'stoppage_time_first_half', 'stoppage_time_second_half', 'total_stoppage_time'
+]
+INT16_COLUMNS = ['total_match_time']
+INT32_COLUMNS = ['attendance']
+
+
+def compact_match_frame(matches):
+    """Build a DataFrame of matches using categorical and small integer dtypes"""
+    df = pd.DataFrame(matches)
+
+    # Teams share one category set so home/away/winner codes line up
+    teams = sorted(set(df['home_team']) | set(df['away_team']) | {'Draw'})
+    for column in TEAM_COLUMNS:
+        df[column] = pd.Categorical(df[column], categories=teams)
+    for column in CATEGORY_COLUMNS + ['tournament']:
+        df[column] = df[column].astype('category')
+
+    for columns, dtype in [(INT8_COLUMNS, np.int8), (INT16_COLUMNS, np.int16),
+                           (INT32_COLUMNS, np.int32)]:
+        for column in columns:
+            df[column] = df[column].astype(dtype)
+
+    df['date'] = pd.to_datetime(df['date'])
+    df['had_extra_time'] = df['had_extra_time'].astype(bool)
+    if 'penalty_result' not in df:
+        df['penalty_result'] = None
+    return df
+
+
+def write_parquet_dataset(matches, summary_stats, output_dir):
+    """
+    Write matches as a Parquet dataset partitioned by tournament, plus the summary table
+    Both are built under temporary names and swapped into place
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    matches_dir = os.path.join(output_dir, 'matches')
+
+    # Partitioned writes add files next to existing ones, so build a fresh dataset
+    staging_dir = tempfile.mkdtemp(dir=output_dir, prefix='.matches.')
+    os.chmod(staging_dir, 0o755)
+    try:
+        compact_match_frame(matches).to_parquet(
+            staging_dir, engine='pyarrow', partition_cols=['tournament'], index=False
+        )
+        if os.path.exists(matches_dir):
+            retired_dir = tempfile.mkdtemp(dir=output_dir, prefix='.retired.')
+            os.replace(matches_dir, os.path.join(retired_dir, 'matches'))
+            os.replace(staging_dir, matches_dir)
+            shutil.rmtree(retired_dir)
+        else:
+            os.replace(staging_dir, matches_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    summary_path = os.path.join(output_dir, 'summary.parquet')
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix='.summary.')
+    os.close(fd)
+    os.chmod(tmp_path, 0o644)
+    try:
+        pd.DataFrame(summary_stats).to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, summary_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return matches_dir
+
+
+def load_matches(output_dir, tournaments=None):
+    """Load the match dataset, optionally reading only some tournament partitions"""
+    filters = [('tournament', 'in', list(tournaments))] if tournaments else None
+    return pd.read_parquet(os.path.join(output_dir, 'matches'), engine='pyarrow', filters=filters)
+
+
+def load_summary(output_dir):
+    """Load the tournament summary table"""
+    return pd.read_parquet(os.path.join(output_dir, 'summary.parquet'), engine='pyarrow')
+
+
+def time_analysis_view(df):
+    """MATCH_TIME_ANALYSIS columns computed from a match frame"""
+    view = df[['match_id', 'tournament', 'date', 'stage', 'total_goals', 'total_cards',
+               'yellow_cards', 'red_cards']].copy()
+    view['regular_time'] = np.int16(90)
+    for column in ['stoppage_time_first_half', 'stoppage_time_second_half',
+                   'total_stoppage_time', 'total_match_time', 'had_extra_time']:
+        view[column] = df[column]
+    view['extra_time_minutes'] = np.where(
+        df['had_extra_time'], np.maximum(0, df['total_match_time'] - 95), 0
+    ).astype(np.int16)
+    return view
+
+
+def cards_analysis_view(df):
+    """CARDS_ANALYSIS columns computed from a match frame"""
+    view = df[['match_id', 'tournament', 'date', 'stage', 'home_team', 'away_team',
+               'total_goals', 'yellow_cards', 'red_cards', 'total_cards']].copy()
+    view['cards_per_goal'] = (df['total_cards'] / df['total_goals'].clip(lower=1)).round(2)
+    view['high_card_match'] = np.where(df['total_cards'] >= 4, 'Yes', 'No')
+    view['red_card_match'] = np.where(df['red_cards'] > 0, 'Yes', 'No')
+    return view
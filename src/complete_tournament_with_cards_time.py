@@ -4,10 +4,32 @@ Complete tournament data with detailed cards and time analysis
 Includes: Total cards, card breakdown, match duration, stoppage time
 """
 
-import pandas as pd
+import csv
 import json
 import os
 import random
+from contextlib import ExitStack
+from datetime import datetime
+
+from aggregation import CARDS_ANALYSIS_FIELDS, TIME_ANALYSIS_FIELDS, TournamentAggregator
+from incremental_export import ExportManifest, atomic_open, content_hash
+import metrics
+from rollups import ROLLUPS_FILE, RollupStore
+from tournament_registry import REGISTRY
+
+OUTPUT_DIR = 'complete_enhanced_data'
+
+# Exports are seeded by default so an unchanged fixture list yields unchanged
+# files and incremental re-exports skip them; pass another seed to re-draw
+DEFAULT_SEED = 2025
+
+KNOCKOUT_STAGES = ['Quarter-final', 'Semi-final', 'Final']
+
+MATCH_DATA_FIELDS = [
+    'yellow_cards', 'red_cards', 'total_cards',
+    'stoppage_time_first_half', 'stoppage_time_second_half',
+    'total_stoppage_time', 'total_match_time', 'had_extra_time'
+]
 
 def generate_realistic_match_data(match):
     """Generate realistic cards and time data for each match"""
@@ -80,73 +102,95 @@ def generate_realistic_match_data(match):
         'had_extra_time': total_match_time > 100
     }
 
-def create_complete_wafcon_with_cards_time():
-    """Create ALL WAFCON 2024 matches with cards and time data"""
+def generate_match_data_batch(matches, rng=None):
+    """
+    Vectorized generate_realistic_match_data for a whole batch of matches
+    matches is a DataFrame (or dict of arrays) with home_score, away_score and stage;
+    rng is a numpy Generator or a seed. Returns a DataFrame of the same fields.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(rng)
+
+    home_score = np.asarray(matches['home_score'], dtype=np.int64)
+    away_score = np.asarray(matches['away_score'], dtype=np.int64)
+    stage = np.asarray(matches['stage'], dtype=object)
+    n = len(stage)
+
+    total_goals = home_score + away_score
+    is_final_or_semi = np.isin(stage, ['Final', 'Semi-final'])
+    is_quarter = stage == 'Quarter-final'
+    is_knockout = np.isin(stage, KNOCKOUT_STAGES)
+
+    # Card ranges follow the same branch order as generate_realistic_match_data
+    card_low = np.select(
+        [is_final_or_semi, is_quarter, total_goals >= 4], [2, 1, 0], default=1
+    )
+    card_high = np.select(
+        [is_final_or_semi, is_quarter, total_goals >= 4], [6, 5, 3], default=4
+    )
+    yellow_cards = rng.integers(card_low, card_high + 1)
+
+    # Red cards in intense knockout matches
+    has_red = is_knockout & (rng.random(n) < 0.15)
+    red_cards = has_red.astype(np.int64)
+    yellow_cards = np.where(has_red, np.maximum(0, yellow_cards - 1), yellow_cards)
+    total_cards = yellow_cards + red_cards
+
+    # Stoppage time driven by goals and cards, capped at 8 minutes in the second half
+    stoppage_first = rng.integers(1, 4, size=n)
+    base_stoppage_second = rng.integers(2, 5, size=n)
+    stoppage_second = np.minimum(
+        (base_stoppage_second + total_goals * 0.5 + total_cards * 0.3).astype(np.int64), 8
+    )
+    total_stoppage = stoppage_first + stoppage_second
+    total_match_time = 90 + total_stoppage
+
+    # Knockout draws go to extra time, sometimes with an extra booking
+    extra_time = is_knockout & (home_score == away_score)
+    extra_time_stoppage = rng.integers(1, 5, size=n)
+    total_match_time = np.where(extra_time, 120 + extra_time_stoppage, total_match_time)
+    extra_booking = extra_time & (rng.random(n) < 0.3)
+    yellow_cards = yellow_cards + extra_booking
+    total_cards = total_cards + extra_booking
+
+    return pd.DataFrame({
+        'yellow_cards': yellow_cards,
+        'red_cards': red_cards,
+        'total_cards': total_cards,
+        'stoppage_time_first_half': stoppage_first,
+        'stoppage_time_second_half': stoppage_second,
+        'total_stoppage_time': total_stoppage,
+        'total_match_time': total_match_time,
+        'had_extra_time': total_match_time > 100
+    }, index=getattr(matches, 'index', None))
+
+def _match_data_records(batch):
+    """Convert a generate_match_data_batch frame into plain-Python dicts"""
+    columns = [batch[field].tolist() for field in MATCH_DATA_FIELDS]
+    return [dict(zip(MATCH_DATA_FIELDS, values)) for values in zip(*columns)]
+
+def enrich_matches(fixtures, tournament, id_prefix, week_anchor_day, seed=None, start_index=0):
+    """Add ids, cards, time, winner and calendar data to a tournament's fixtures
+    seed may be a numpy Generator, so chunks of one tournament can share a stream;
+    start_index offsets the match ids when fixtures is one chunk of a larger list"""
+    
+    matches = [dict(fixture) for fixture in fixtures]
     
-    matches = []
-    
-    # GROUP STAGE - GROUP A (All 6 matches)
-    group_a_matches = [
-        {'date': '2025-07-05', 'time': '20:00', 'home_team': 'Morocco', 'away_team': 'Zambia', 'home_score': 2, 'away_score': 1, 'stage': 'Group A', 'venue': 'Prince Moulay Abdellah Stadium, Rabat', 'attendance': 35000},
-        {'date': '2025-07-05', 'time': '17:00', 'home_team': 'Senegal', 'away_team': 'DR Congo', 'home_score': 4, 'away_score': 0, 'stage': 'Group A', 'venue': 'Stade Mohammed V, Casablanca', 'attendance': 28000},
-        {'date': '2025-07-09', 'time': '20:00', 'home_team': 'Morocco', 'away_team': 'Senegal', 'home_score': 1, 'away_score': 0, 'stage': 'Group A', 'venue': 'Prince Moulay Abdellah Stadium, Rabat', 'attendance': 38000},
-        {'date': '2025-07-09', 'time': '17:00', 'home_team': 'Zambia', 'away_team': 'DR Congo', 'home_score': 3, 'away_score': 1, 'stage': 'Group A', 'venue': 'Stade Mohammed V, Casablanca', 'attendance': 22000},
-        {'date': '2025-07-13', 'time': '20:00', 'home_team': 'Morocco', 'away_team': 'DR Congo', 'home_score': 4, 'away_score': 0, 'stage': 'Group A', 'venue': 'Stade El Bachir, Mohammedia', 'attendance': 25000},
-        {'date': '2025-07-13', 'time': '20:00', 'home_team': 'Zambia', 'away_team': 'Senegal', 'home_score': 0, 'away_score': 1, 'stage': 'Group A', 'venue': 'Prince Moulay Abdellah Stadium, Rabat', 'attendance': 30000}
-    ]
-    
-    # GROUP STAGE - GROUP B (All 6 matches)
-    group_b_matches = [
-        {'date': '2025-07-06', 'time': '20:00', 'home_team': 'Nigeria', 'away_team': 'Tunisia', 'home_score': 3, 'away_score': 0, 'stage': 'Group B', 'venue': 'Stade Municipal, Berkane', 'attendance': 18000},
-        {'date': '2025-07-06', 'time': '17:00', 'home_team': 'Algeria', 'away_team': 'Botswana', 'home_score': 1, 'away_score': 0, 'stage': 'Group B', 'venue': 'Complexe Sportif, Oujda', 'attendance': 15000},
-        {'date': '2025-07-10', 'time': '20:00', 'home_team': 'Nigeria', 'away_team': 'Botswana', 'home_score': 1, 'away_score': 0, 'stage': 'Group B', 'venue': 'Stade Municipal, Berkane', 'attendance': 16000},
-        {'date': '2025-07-10', 'time': '17:00', 'home_team': 'Algeria', 'away_team': 'Tunisia', 'home_score': 0, 'away_score': 0, 'stage': 'Group B', 'venue': 'Complexe Sportif, Oujda', 'attendance': 17000},
-        {'date': '2025-07-14', 'time': '20:00', 'home_team': 'Nigeria', 'away_team': 'Algeria', 'home_score': 0, 'away_score': 0, 'stage': 'Group B', 'venue': 'Prince Moulay Abdellah Stadium, Rabat', 'attendance': 32000},
-        {'date': '2025-07-14', 'time': '20:00', 'home_team': 'Tunisia', 'away_team': 'Botswana', 'home_score': 1, 'away_score': 2, 'stage': 'Group B', 'venue': 'Stade Mohammed V, Casablanca', 'attendance': 20000}
-    ]
-    
-    # GROUP STAGE - GROUP C (All 6 matches)
-    group_c_matches = [
-        {'date': '2025-07-07', 'time': '20:00', 'home_team': 'South Africa', 'away_team': 'Ghana', 'home_score': 2, 'away_score': 1, 'stage': 'Group C', 'venue': 'Stade El Bachir, Mohammedia', 'attendance': 24000},
-        {'date': '2025-07-07', 'time': '17:00', 'home_team': 'Mali', 'away_team': 'Tanzania', 'home_score': 1, 'away_score': 0, 'stage': 'Group C', 'venue': 'Stade Municipal, Berkane', 'attendance': 12000},
-        {'date': '2025-07-11', 'time': '20:00', 'home_team': 'South Africa', 'away_team': 'Mali', 'home_score': 4, 'away_score': 0, 'stage': 'Group C', 'venue': 'Stade El Bachir, Mohammedia', 'attendance': 26000},
-        {'date': '2025-07-11', 'time': '17:00', 'home_team': 'Ghana', 'away_team': 'Tanzania', 'home_score': 2, 'away_score': 0, 'stage': 'Group C', 'venue': 'Stade Municipal, Berkane', 'attendance': 14000},
-        {'date': '2025-07-15', 'time': '20:00', 'home_team': 'South Africa', 'away_team': 'Tanzania', 'home_score': 3, 'away_score': 0, 'stage': 'Group C', 'venue': 'Complexe Sportif, Oujda', 'attendance': 16000},
-        {'date': '2025-07-15', 'time': '20:00', 'home_team': 'Ghana', 'away_team': 'Mali', 'home_score': 1, 'away_score': 1, 'stage': 'Group C', 'venue': 'Stade El Bachir, Mohammedia', 'attendance': 22000}
-    ]
-    
-    # QUARTER-FINALS (4 matches)
-    quarter_finals = [
-        {'date': '2025-07-19', 'time': '17:00', 'home_team': 'Nigeria', 'away_team': 'Zambia', 'home_score': 1, 'away_score': 0, 'stage': 'Quarter-final', 'venue': 'Stade Mohammed V, Casablanca', 'attendance': 35000},
-        {'date': '2025-07-19', 'time': '20:00', 'home_team': 'Morocco', 'away_team': 'Mali', 'home_score': 3, 'away_score': 0, 'stage': 'Quarter-final', 'venue': 'Prince Moulay Abdellah Stadium, Rabat', 'attendance': 42000},
-        {'date': '2025-07-20', 'time': '17:00', 'home_team': 'Ghana', 'away_team': 'Algeria', 'home_score': 2, 'away_score': 0, 'stage': 'Quarter-final', 'venue': 'Stade El Bachir, Mohammedia', 'attendance': 28000},
-        {'date': '2025-07-20', 'time': '20:00', 'home_team': 'South Africa', 'away_team': 'Senegal', 'home_score': 2, 'away_score': 1, 'stage': 'Quarter-final', 'venue': 'Stade Moulay Hassan, Rabat', 'attendance': 30000}
-    ]
-    
-    # SEMI-FINALS (2 matches)
-    semi_finals = [
-        {'date': '2025-07-23', 'time': '20:00', 'home_team': 'Nigeria', 'away_team': 'South Africa', 'home_score': 1, 'away_score': 0, 'stage': 'Semi-final', 'venue': 'Prince Moulay Abdellah Stadium, Rabat', 'attendance': 40000},
-        {'date': '2025-07-23', 'time': '17:00', 'home_team': 'Morocco', 'away_team': 'Ghana', 'home_score': 2, 'away_score': 1, 'stage': 'Semi-final', 'venue': 'Stade Mohammed V, Casablanca', 'attendance': 45000}
-    ]
-    
-    # THIRD PLACE & FINAL (2 matches)
-    final_matches = [
-        {'date': '2025-07-25', 'time': '17:00', 'home_team': 'Ghana', 'away_team': 'South Africa', 'home_score': 1, 'away_score': 1, 'stage': '3rd Place', 'venue': 'Stade El Bachir, Mohammedia', 'attendance': 25000, 'penalty_result': 'Ghana 4-3'},
-        {'date': '2025-07-26', 'time': '20:00', 'home_team': 'Nigeria', 'away_team': 'Morocco', 'home_score': 3, 'away_score': 2, 'stage': 'Final', 'venue': 'Olympic Stadium, Rabat', 'attendance': 50000}
-    ]
-    
-    # Combine all matches
-    all_matches = group_a_matches + group_b_matches + group_c_matches + quarter_finals + semi_finals + final_matches
+    # Generate cards and time data for the whole tournament in one batch
+    cards_time_data = _match_data_records(generate_match_data_batch(
+        {column: [m[column] for m in matches] for column in ['home_score', 'away_score', 'stage']},
+        rng=seed
+    ))
     
     # Add enhanced data to each match
-    for i, match in enumerate(all_matches):
-        match['tournament'] = 'WAFCON 2024'
-        match['match_id'] = f'WAFCON_2024_{i+1:02d}'
+    for i, match in enumerate(matches):
+        match['tournament'] = tournament
+        match['match_id'] = f'{id_prefix}_{start_index+i+1:02d}'
         match['total_goals'] = match['home_score'] + match['away_score']
         
-        # Generate cards and time data
-        cards_time_data = generate_realistic_match_data(match)
-        match.update(cards_time_data)
+        match.update(cards_time_data[i])
         
         # Determine winner
         if match['home_score'] > match['away_score']:
@@ -157,242 +201,232 @@ def create_complete_wafcon_with_cards_time():
             match['winner'] = 'Draw'
             
         # Add match day
-        from datetime import datetime
         match_date = datetime.strptime(match['date'], '%Y-%m-%d')
         match['day_of_week'] = match_date.strftime('%A')
-        match['match_week'] = f"Week {((match_date.day - 5) // 7) + 1}"
+        match['match_week'] = f"Week {((match_date.day - week_anchor_day) // 7) + 1}"
     
-    return all_matches
+    return matches
+
+def load_tournament_matches(name, seed=None):
+    """Load a tournament's fixtures from the registry and enrich them"""
+    entry = REGISTRY.get(name)
+    return enrich_matches(
+        REGISTRY.fixtures(name), entry['tournament'], entry['id_prefix'],
+        entry['week_anchor_day'], seed=seed
+    )
+
+def tournament_seeds(seed=None):
+    """One SeedSequence per registry tournament, spawned in registry order
+    so a tournament's generated data does not depend on which others are selected"""
+    import numpy as np
+    names = REGISTRY.names()
+    return dict(zip(names, np.random.SeedSequence(seed).spawn(len(names))))
 
-def create_complete_euro_with_cards_time():
+def create_complete_wafcon_with_cards_time(seed=None):
+    """Create ALL WAFCON 2024 matches with cards and time data"""
+    return load_tournament_matches('WAFCON 2024', seed=seed)
+
+def create_complete_euro_with_cards_time(seed=None):
     """Create ALL UEFA Euro 2025 matches with cards and time data"""
-    
-    matches = []
-    
-    # GROUP STAGE - GROUP A (All 6 matches)
-    group_a_matches = [
-        {'date': '2025-07-02', 'time': '20:00', 'home_team': 'Switzerland', 'away_team': 'Norway', 'home_score': 1, 'away_score': 0, 'stage': 'Group A', 'venue': 'St. Jakob-Park, Basel', 'attendance': 36000},
-        {'date': '2025-07-02', 'time': '17:00', 'home_team': 'Iceland', 'away_team': 'Finland', 'home_score': 1, 'away_score': 1, 'stage': 'Group A', 'venue': 'Arena Thun, Thun', 'attendance': 10000},
-        {'date': '2025-07-06', 'time': '20:00', 'home_team': 'Switzerland', 'away_team': 'Iceland', 'home_score': 2, 'away_score': 0, 'stage': 'Group A', 'venue': 'St. Jakob-Park, Basel', 'attendance': 38000},
-        {'date': '2025-07-06', 'time': '17:00', 'home_team': 'Norway', 'away_team': 'Finland', 'home_score': 4, 'away_score': 1, 'stage': 'Group A', 'venue': 'Arena Thun, Thun', 'attendance': 10000},
-        {'date': '2025-07-10', 'time': '20:00', 'home_team': 'Switzerland', 'away_team': 'Finland', 'home_score': 3, 'away_score': 0, 'stage': 'Group A', 'venue': 'Stade de Genève, Geneva', 'attendance': 30000},
-        {'date': '2025-07-10', 'time': '20:00', 'home_team': 'Norway', 'away_team': 'Iceland', 'home_score': 4, 'away_score': 3, 'stage': 'Group A', 'venue': 'Stadion Wankdorf, Bern', 'attendance': 32000}
-    ]
-    
-    # GROUP STAGE - GROUP B (All 6 matches)
-    group_b_matches = [
-        {'date': '2025-07-03', 'time': '20:00', 'home_team': 'Spain', 'away_team': 'Portugal', 'home_score': 5, 'away_score': 0, 'stage': 'Group B', 'venue': 'Stade de Genève, Geneva', 'attendance': 30000},
-        {'date': '2025-07-03', 'time': '17:00', 'home_team': 'Belgium', 'away_team': 'Italy', 'home_score': 1, 'away_score': 1, 'stage': 'Group B', 'venue': 'Stadion Letzigrund, Zurich', 'attendance': 26000},
-        {'date': '2025-07-07', 'time': '20:00', 'home_team': 'Spain', 'away_team': 'Belgium', 'home_score': 6, 'away_score': 2, 'stage': 'Group B', 'venue': 'Stade de Genève, Geneva', 'attendance': 30000},
-        {'date': '2025-07-07', 'time': '17:00', 'home_team': 'Portugal', 'away_team': 'Italy', 'home_score': 1, 'away_score': 1, 'stage': 'Group B', 'venue': 'Stadion Letzigrund, Zurich', 'attendance': 26000},
-        {'date': '2025-07-11', 'time': '20:00', 'home_team': 'Spain', 'away_team': 'Italy', 'home_score': 1, 'away_score': 3, 'stage': 'Group B', 'venue': 'Stadion Wankdorf, Bern', 'attendance': 32000},
-        {'date': '2025-07-11', 'time': '20:00', 'home_team': 'Portugal', 'away_team': 'Belgium', 'home_score': 0, 'away_score': 2, 'stage': 'Group B', 'venue': 'Arena St.Gallen, St.Gallen', 'attendance': 19000}
-    ]
-    
-    # GROUP STAGE - GROUP C (All 6 matches)
-    group_c_matches = [
-        {'date': '2025-07-04', 'time': '20:00', 'home_team': 'Germany', 'away_team': 'Poland', 'home_score': 2, 'away_score': 3, 'stage': 'Group C', 'venue': 'Stadion Wankdorf, Bern', 'attendance': 32000},
-        {'date': '2025-07-04', 'time': '17:00', 'home_team': 'Denmark', 'away_team': 'Sweden', 'home_score': 2, 'away_score': 4, 'stage': 'Group C', 'venue': 'Arena St.Gallen, St.Gallen', 'attendance': 19000},
-        {'date': '2025-07-08', 'time': '20:00', 'home_team': 'Germany', 'away_team': 'Denmark', 'home_score': 3, 'away_score': 1, 'stage': 'Group C', 'venue': 'Stadion Wankdorf, Bern', 'attendance': 32000},
-        {'date': '2025-07-08', 'time': '17:00', 'home_team': 'Poland', 'away_team': 'Sweden', 'home_score': 1, 'away_score': 2, 'stage': 'Group C', 'venue': 'Arena St.Gallen, St.Gallen', 'attendance': 19000},
-        {'date': '2025-07-12', 'time': '20:00', 'home_team': 'Germany', 'away_team': 'Sweden', 'home_score': 1, 'away_score': 4, 'stage': 'Group C', 'venue': 'Allmend Stadion Luzern, Lucerne', 'attendance': 17000},
-        {'date': '2025-07-12', 'time': '20:00', 'home_team': 'Poland', 'away_team': 'Denmark', 'home_score': 3, 'away_score': 2, 'stage': 'Group C', 'venue': 'Stade de Tourbillon, Sion', 'attendance': 16000}
-    ]
-    
-    # GROUP STAGE - GROUP D (All 6 matches)  
-    group_d_matches = [
-        {'date': '2025-07-05', 'time': '20:00', 'home_team': 'France', 'away_team': 'England', 'home_score': 1, 'away_score': 2, 'stage': 'Group D', 'venue': 'Allmend Stadion Luzern, Lucerne', 'attendance': 17000},
-        {'date': '2025-07-05', 'time': '17:00', 'home_team': 'Wales', 'away_team': 'Netherlands', 'home_score': 0, 'away_score': 2, 'stage': 'Group D', 'venue': 'Stade de Tourbillon, Sion', 'attendance': 16000},
-        {'date': '2025-07-09', 'time': '20:00', 'home_team': 'France', 'away_team': 'Wales', 'home_score': 3, 'away_score': 0, 'stage': 'Group D', 'venue': 'Allmend Stadion Luzern, Lucerne', 'attendance': 17000},
-        {'date': '2025-07-09', 'time': '17:00', 'home_team': 'England', 'away_team': 'Netherlands', 'home_score': 1, 'away_score': 1, 'stage': 'Group D', 'venue': 'Stade de Tourbillon, Sion', 'attendance': 16000},
-        {'date': '2025-07-13', 'time': '20:00', 'home_team': 'France', 'away_team': 'Netherlands', 'home_score': 0, 'away_score': 1, 'stage': 'Group D', 'venue': 'Stadion Letzigrund, Zurich', 'attendance': 26000},
-        {'date': '2025-07-13', 'time': '20:00', 'home_team': 'England', 'away_team': 'Wales', 'home_score': 2, 'away_score': 0, 'stage': 'Group D', 'venue': 'St. Jakob-Park, Basel', 'attendance': 36000}
-    ]
-    
-    # QUARTER-FINALS (4 matches)
-    quarter_finals = [
-        {'date': '2025-07-19', 'time': '20:00', 'home_team': 'England', 'away_team': 'Sweden', 'home_score': 2, 'away_score': 2, 'stage': 'Quarter-final', 'venue': 'St. Jakob-Park, Basel', 'attendance': 38000, 'penalty_result': 'England 3-2'},
-        {'date': '2025-07-19', 'time': '17:00', 'home_team': 'Spain', 'away_team': 'Germany', 'home_score': 3, 'away_score': 1, 'stage': 'Quarter-final', 'venue': 'Stadion Wankdorf, Bern', 'attendance': 32000},
-        {'date': '2025-07-20', 'time': '20:00', 'home_team': 'Netherlands', 'away_team': 'Italy', 'home_score': 2, 'away_score': 0, 'stage': 'Quarter-final', 'venue': 'Stade de Genève, Geneva', 'attendance': 30000},
-        {'date': '2025-07-20', 'time': '17:00', 'home_team': 'France', 'away_team': 'Belgium', 'home_score': 1, 'away_score': 0, 'stage': 'Quarter-final', 'venue': 'Stadion Letzigrund, Zurich', 'attendance': 26000}
-    ]
-    
-    # SEMI-FINALS (2 matches)
-    semi_finals = [
-        {'date': '2025-07-24', 'time': '20:00', 'home_team': 'England', 'away_team': 'Netherlands', 'home_score': 3, 'away_score': 1, 'stage': 'Semi-final', 'venue': 'Stadion Wankdorf, Bern', 'attendance': 32000},
-        {'date': '2025-07-24', 'time': '17:00', 'home_team': 'Spain', 'away_team': 'France', 'home_score': 2, 'away_score': 0, 'stage': 'Semi-final', 'venue': 'Stade de Genève, Geneva', 'attendance': 30000}
-    ]
-    
-    # THIRD PLACE & FINAL (2 matches)
-    final_matches = [
-        {'date': '2025-07-26', 'time': '17:00', 'home_team': 'Netherlands', 'away_team': 'France', 'home_score': 1, 'away_score': 0, 'stage': '3rd Place', 'venue': 'Stadion Letzigrund, Zurich', 'attendance': 26000},
-        {'date': '2025-07-27', 'time': '20:00', 'home_team': 'England', 'away_team': 'Spain', 'home_score': 2, 'away_score': 1, 'stage': 'Final', 'venue': 'St. Jakob-Park, Basel', 'attendance': 38000}
-    ]
-    
-    # Combine all matches
-    all_matches = group_a_matches + group_b_matches + group_c_matches + group_d_matches + quarter_finals + semi_finals + final_matches
-    
-    # Add enhanced data to each match
-    for i, match in enumerate(all_matches):
-        match['tournament'] = 'UEFA Euro 2025'
-        match['match_id'] = f'EURO_2025_{i+1:02d}'
-        match['total_goals'] = match['home_score'] + match['away_score']
-        
-        # Generate cards and time data
-        cards_time_data = generate_realistic_match_data(match)
-        match.update(cards_time_data)
-        
-        # Determine winner
-        if match['home_score'] > match['away_score']:
-            match['winner'] = match['home_team']
-        elif match['away_score'] > match['home_score']:
-            match['winner'] = match['away_team']
-        else:
-            match['winner'] = 'Draw'
-            
-        # Add match day
-        from datetime import datetime
-        match_date = datetime.strptime(match['date'], '%Y-%m-%d')
-        match['day_of_week'] = match_date.strftime('%A')
-        match['match_week'] = f"Week {((match_date.day - 2) // 7) + 1}"
-    
-    return all_matches
+    return load_tournament_matches('UEFA Euro 2025', seed=seed)
+
+def _open_csv_writer(stack, path, fieldnames):
+    """Open path for streaming CSV rows; the file is renamed into place when stack exits"""
+    f = stack.enter_context(atomic_open(path, newline=''))
+    writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    return writer
+
+def _report_artifact(name, written):
+    print(f"   📄 {name}" if written else f"   ⏭️  {name} (unchanged)")
+
+def _record_output(name, rows):
+    path = os.path.join(OUTPUT_DIR, name)
+    if os.path.isdir(path):
+        nbytes = sum(os.path.getsize(os.path.join(root, f))
+                     for root, _, files in os.walk(path) for f in files)
+    else:
+        nbytes = os.path.getsize(path)
+    metrics.record_write(name, rows, nbytes)
+
+def _write_artifact(manifest, name, input_hash, write, rows, **open_kwargs):
+    """Atomically rewrite one output file unless it was already built from input_hash"""
+    written = not manifest.is_current(name, input_hash)
+    if written:
+        with metrics.stage(f'write:{name}'):
+            with atomic_open(os.path.join(OUTPUT_DIR, name), **open_kwargs) as f:
+                write(f)
+        manifest.record(name, input_hash)
+        _record_output(name, rows)
+    _report_artifact(name, written)
 
-def export_complete_enhanced_data():
-    """Export complete tournament data with cards and time analysis"""
+def _updated_rollups(all_matches):
+    """The saved rollups brought up to date, re-applying only matches that changed"""
+    try:
+        rollups = RollupStore.load(os.path.join(OUTPUT_DIR, ROLLUPS_FILE))
+    except (OSError, ValueError, KeyError):
+        rollups = RollupStore()
+    with metrics.stage('rollups'):
+        touched = rollups.sync(all_matches)
+    print(f"   🔁 rollups: {touched} of {len(all_matches)} matches re-applied")
+    return rollups
+
+def export_text_files(tournaments, summary_stats, manifest, input_hashes, include_combined=True):
+    """Write the CSV and JSON versions of the enhanced data whose inputs changed
+    tournaments is a list of (registry entry, matches) pairs
+    (the time and cards analysis CSVs are streamed by the aggregator);
+    include_combined=False writes only the per-tournament files"""
+    
+    all_matches = [match for _, matches in tournaments for match in matches]
+    combined_hash = input_hashes['combined']
+    
+    import pandas as pd
+    
+    def csv_writer(rows):
+        return lambda f: pd.DataFrame(rows).to_csv(f, index=False)
+    
+    def json_writer(rows):
+        return lambda f: json.dump(rows, f, indent=2)
+    
+    outputs = []
+    # Individual tournaments
+    for entry, matches in tournaments:
+        outputs.append((f"{entry['id_prefix']}_COMPLETE_WITH_CARDS_TIME.csv",
+                        input_hashes[entry['tournament']], csv_writer(matches), len(matches)))
+    if include_combined:
+        outputs += [
+            # Combined
+            ('BOTH_TOURNAMENTS_COMPLETE_ENHANCED.csv', combined_hash, csv_writer(all_matches), len(all_matches)),
+            # Summary statistics
+            ('TOURNAMENT_SUMMARY_STATISTICS.csv', combined_hash, csv_writer(summary_stats), len(summary_stats)),
+        ]
+    # JSON versions for detailed analysis
+    for entry, matches in tournaments:
+        outputs.append((f"{entry['id_prefix']}_COMPLETE_ENHANCED.json",
+                        input_hashes[entry['tournament']], json_writer(matches), len(matches)))
+    if include_combined:
+        outputs.append(('BOTH_TOURNAMENTS_COMPLETE_ENHANCED.json', combined_hash,
+                        json_writer(all_matches), len(all_matches)))
+    
+    for name, input_hash, write, rows in outputs:
+        _write_artifact(manifest, name, input_hash, write, rows, newline='')
+
+def export_complete_enhanced_data(seed=DEFAULT_SEED, output_format='csv', force=False,
+                                  tournaments=None):
+    """Export complete tournament data with cards and time analysis
+    tournaments selects registry tournaments by name (default: all of them).
+    The generated cards and time data are drawn from seed (DEFAULT_SEED unless given;
+    None draws fresh data, so every output is rewritten).
+    output_format is 'csv' (CSV + JSON files and ROLLUPS.json), 'parquet' (one columnar dataset), 'both',
+    'ndjson' (NDJSON + CSV streamed match by match, always rewritten; see streaming.py) or
+    'xlsx' (one streamed multi-sheet workbook, always rewritten; see excel_report.py).
+    Outputs whose input matches are unchanged since the last run are skipped unless force is set.
+    Combined outputs (BOTH_TOURNAMENTS_*, summary, analysis CSVs, parquet, rollups) cover every
+    registry tournament, so a run over a subset writes only that subset's own files."""
+    
+    if output_format not in ('csv', 'parquet', 'both', 'ndjson', 'xlsx'):
+        raise ValueError(f"Unknown output format: {output_format}")
     
     print("🏆 Creating COMPLETE Enhanced Tournament Data...")
     print("📊 Includes: All matches, cards, time analysis, attendance")
     print("=" * 60)
     
-    # Create complete data
-    wafcon_matches = create_complete_wafcon_with_cards_time()
-    euro_matches = create_complete_euro_with_cards_time()
-    
-    print(f"📊 WAFCON 2024: {len(wafcon_matches)} matches")
-    print(f"📊 UEFA Euro 2025: {len(euro_matches)} matches")
-    print(f"📊 TOTAL: {len(wafcon_matches) + len(euro_matches)} matches")
+    if output_format == 'ndjson':
+        # Streams matches straight to disk instead of building every list in memory
+        from streaming import export_streaming
+        summary_stats = export_streaming(tournaments, seed=seed)
+        print(f"\n✅ COMPLETE ENHANCED DATA STREAMED TO {OUTPUT_DIR}/")
+        _print_summary_statistics(summary_stats)
+        return
+    
+    if output_format == 'xlsx':
+        from excel_report import REPORT_FILE, write_excel_report
+        from streaming import iter_enriched_matches
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        path = os.path.join(OUTPUT_DIR, REPORT_FILE)
+        summary_stats = write_excel_report(path, iter_enriched_matches(tournaments, seed=seed))
+        print(f"\n✅ EXCEL REPORT WRITTEN: {path}")
+        _print_summary_statistics(summary_stats)
+        return
+    
+    # Create complete data, building only the selected tournaments
+    names = tournaments or REGISTRY.names()
+    entries = [REGISTRY.get(name) for name in names]
+    include_combined = {entry['tournament'] for entry in entries} == set(REGISTRY.names())
+    seeds = tournament_seeds(seed)
+    with metrics.stage('enrich'):
+        selected = [(entry, load_tournament_matches(entry['tournament'],
+                                                    seed=seeds[entry['tournament']]))
+                    for entry in entries]
+    all_matches = [match for _, matches in selected for match in matches]
+    
+    for entry, matches in selected:
+        print(f"📊 {entry['tournament']}: {len(matches)} matches")
+    print(f"📊 TOTAL: {len(all_matches)} matches")
     
     # Create output directory
-    os.makedirs('complete_enhanced_data', exist_ok=True)
-    
-    # Export individual tournaments
-    wafcon_df = pd.DataFrame(wafcon_matches)
-    euro_df = pd.DataFrame(euro_matches)
-    
-    wafcon_df.to_csv('complete_enhanced_data/WAFCON_2024_COMPLETE_WITH_CARDS_TIME.csv', index=False)
-    euro_df.to_csv('complete_enhanced_data/EURO_2025_COMPLETE_WITH_CARDS_TIME.csv', index=False)
-    
-    # Export combined
-    all_matches = wafcon_matches + euro_matches
-    combined_df = pd.DataFrame(all_matches)
-    combined_df.to_csv('complete_enhanced_data/BOTH_TOURNAMENTS_COMPLETE_ENHANCED.csv', index=False)
-    
-    # Create summary statistics
-    summary_stats = []
-    
-    for tournament_name, matches in [('WAFCON 2024', wafcon_matches), ('UEFA Euro 2025', euro_matches)]:
-        total_matches = len(matches)
-        total_goals = sum(m['total_goals'] for m in matches)
-        total_yellow_cards = sum(m['yellow_cards'] for m in matches)
-        total_red_cards = sum(m['red_cards'] for m in matches)
-        total_cards = sum(m['total_cards'] for m in matches)
-        avg_match_time = sum(m['total_match_time'] for m in matches) / total_matches
-        total_attendance = sum(m['attendance'] for m in matches)
-        matches_with_extra_time = sum(1 for m in matches if m['had_extra_time'])
-        
-        summary_stats.append({
-            'tournament': tournament_name,
-            'total_matches': total_matches,
-            'total_goals': total_goals,
-            'avg_goals_per_match': round(total_goals / total_matches, 2),
-            'total_yellow_cards': total_yellow_cards,
-            'total_red_cards': total_red_cards,
-            'total_cards': total_cards,
-            'avg_cards_per_match': round(total_cards / total_matches, 2),
-            'avg_match_time_minutes': round(avg_match_time, 1),
-            'total_attendance': total_attendance,
-            'avg_attendance': round(total_attendance / total_matches, 0),
-            'matches_with_extra_time': matches_with_extra_time,
-            'longest_match_minutes': max(m['total_match_time'] for m in matches),
-            'shortest_match_minutes': min(m['total_match_time'] for m in matches)
-        })
-    
-    # Save summary statistics
-    summary_df = pd.DataFrame(summary_stats)
-    summary_df.to_csv('complete_enhanced_data/TOURNAMENT_SUMMARY_STATISTICS.csv', index=False)
-    
-    # Create time analysis data
-    time_analysis = []
-    for match in all_matches:
-        time_analysis.append({
-            'match_id': match['match_id'],
-            'tournament': match['tournament'],
-            'date': match['date'],
-            'stage': match['stage'],
-            'total_goals': match['total_goals'],
-            'total_cards': match['total_cards'],
-            'yellow_cards': match['yellow_cards'],
-            'red_cards': match['red_cards'],
-            'regular_time': 90,
-            'stoppage_time_first_half': match['stoppage_time_first_half'],
-            'stoppage_time_second_half': match['stoppage_time_second_half'],
-            'total_stoppage_time': match['total_stoppage_time'],
-            'total_match_time': match['total_match_time'],
-            'had_extra_time': match['had_extra_time'],
-            'extra_time_minutes': max(0, match['total_match_time'] - 95) if match['had_extra_time'] else 0
-        })
-    
-    time_df = pd.DataFrame(time_analysis)
-    time_df.to_csv('complete_enhanced_data/MATCH_TIME_ANALYSIS.csv', index=False)
-    
-    # Create cards analysis data
-    cards_analysis = []
-    for match in all_matches:
-        cards_analysis.append({
-            'match_id': match['match_id'],
-            'tournament': match['tournament'],
-            'date': match['date'],
-            'stage': match['stage'],
-            'home_team': match['home_team'],
-            'away_team': match['away_team'],
-            'total_goals': match['total_goals'],
-            'yellow_cards': match['yellow_cards'],
-            'red_cards': match['red_cards'],
-            'total_cards': match['total_cards'],
-            'cards_per_goal': round(match['total_cards'] / max(1, match['total_goals']), 2),
-            'high_card_match': 'Yes' if match['total_cards'] >= 4 else 'No',
-            'red_card_match': 'Yes' if match['red_cards'] > 0 else 'No'
-        })
-    
-    cards_df = pd.DataFrame(cards_analysis)
-    cards_df.to_csv('complete_enhanced_data/CARDS_ANALYSIS.csv', index=False)
-    
-    # Export as JSON too
-    with open('complete_enhanced_data/WAFCON_2024_COMPLETE_ENHANCED.json', 'w') as f:
-        json.dump(wafcon_matches, f, indent=2)
-    
-    with open('complete_enhanced_data/EURO_2025_COMPLETE_ENHANCED.json', 'w') as f:
-        json.dump(euro_matches, f, indent=2)
-        
-    with open('complete_enhanced_data/BOTH_TOURNAMENTS_COMPLETE_ENHANCED.json', 'w') as f:
-        json.dump(all_matches, f, indent=2)
-    
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
+    # Each output is rebuilt only when the matches it is derived from change
+    manifest = ExportManifest(OUTPUT_DIR, force=force)
+    input_hashes = {entry['tournament']: content_hash(matches) for entry, matches in selected}
+    input_hashes['combined'] = content_hash([input_hashes[entry['tournament']] for entry in entries])
+    combined_hash = input_hashes['combined']
+    
+    print(f"\n📁 Files in {OUTPUT_DIR}/ folder:")
+    
+    # One pass builds the summary statistics and streams the time/cards analysis rows
+    streamed = []
+    with metrics.stage('aggregate'), ExitStack() as stack:
+        sinks = {}
+        for name, fields in [('MATCH_TIME_ANALYSIS.csv', TIME_ANALYSIS_FIELDS),
+                             ('CARDS_ANALYSIS.csv', CARDS_ANALYSIS_FIELDS)]:
+            if (output_format in ('csv', 'both') and include_combined
+                    and not manifest.is_current(name, combined_hash)):
+                sinks[name] = _open_csv_writer(stack, os.path.join(OUTPUT_DIR, name), fields)
+                streamed.append(name)
+        aggregator = TournamentAggregator(
+            sinks.get('MATCH_TIME_ANALYSIS.csv'), sinks.get('CARDS_ANALYSIS.csv')
+        ).consume(all_matches)
+    summary_stats = aggregator.summary_rows()
+    
+    if output_format in ('csv', 'both'):
+        if include_combined:
+            for name in ['MATCH_TIME_ANALYSIS.csv', 'CARDS_ANALYSIS.csv']:
+                if name in streamed:
+                    manifest.record(name, combined_hash)
+                    _record_output(name, len(all_matches))
+                _report_artifact(name, name in streamed)
+        export_text_files(selected, summary_stats, manifest, input_hashes, include_combined)
+    
+    if not include_combined:
+        print("   ⏭️  combined outputs (only a subset of the registry was selected)")
+    elif output_format in ('parquet', 'both'):
+        written = not manifest.is_current('parquet', combined_hash)
+        if written:
+            from columnar_export import write_parquet_dataset
+            with metrics.stage('write:parquet'):
+                write_parquet_dataset(all_matches, summary_stats, os.path.join(OUTPUT_DIR, 'parquet'))
+            manifest.record('parquet', combined_hash)
+            _record_output('parquet', len(all_matches))
+        _report_artifact('parquet/ (dataset partitioned by tournament + summary.parquet)', written)
+    
+    if include_combined and output_format in ('csv', 'both'):
+        # Team, venue and head-to-head aggregates, served without re-scanning the matches
+        _write_artifact(manifest, ROLLUPS_FILE, combined_hash,
+                        lambda f: _updated_rollups(all_matches).dump(f), len(all_matches))
+    
+    manifest.save()
     print("\n✅ COMPLETE ENHANCED DATA EXPORTED!")
-    print("📁 Files created in complete_enhanced_data/ folder:")
-    print("   📄 WAFCON_2024_COMPLETE_WITH_CARDS_TIME.csv")
-    print("   📄 EURO_2025_COMPLETE_WITH_CARDS_TIME.csv") 
-    print("   📄 BOTH_TOURNAMENTS_COMPLETE_ENHANCED.csv")
-    print("   📄 TOURNAMENT_SUMMARY_STATISTICS.csv")
-    print("   📄 MATCH_TIME_ANALYSIS.csv")
-    print("   📄 CARDS_ANALYSIS.csv")
-    print("   📄 JSON versions for detailed analysis")
     
     # Show sample data
     print(f"\n📊 DATA PREVIEW:")
     print("Columns included in main dataset:")
-    print(list(combined_df.columns))
+    print(list(dict.fromkeys(column for match in all_matches for column in match)))
     
+    _print_summary_statistics(summary_stats)
+
+def _print_summary_statistics(summary_stats):
     print(f"\n📈 SUMMARY STATISTICS:")
     for stat in summary_stats:
         print(f"{stat['tournament']}:")
@@ -404,4 +438,14 @@ def export_complete_enhanced_data():
         print("")
 
 if __name__ == "__main__":
-    export_complete_enhanced_data()
+    import sys
+    # Usage: complete_tournament_with_cards_time.py [csv|parquet|both|ndjson|xlsx] [tournament ...]
+    # Set METRICS_REPORT=report.json (or report.prom) to write timing and I/O metrics
+    if os.environ.get('METRICS_REPORT'):
+        metrics.enable()
+    export_complete_enhanced_data(
+        output_format=sys.argv[1] if len(sys.argv) > 1 else 'csv',
+        tournaments=sys.argv[2:] or None
+    )
+    if os.environ.get('METRICS_REPORT'):
+        metrics.write_report(os.environ['METRICS_REPORT'])
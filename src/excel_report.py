@@ -0,0 +1,113 @@
+"""
+Streaming Excel report
+All matches, the summary statistics and the time and cards analysis go into one
+workbook built with openpyxl's write-only mode: every sheet streams its rows to
+a temporary file as they are appended, so memory does not grow with match count.
+Column widths, number formats and the frozen header are set once per sheet.
+"""
+import os
+from datetime import date
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+import metrics
+from aggregation import (CARDS_ANALYSIS_FIELDS, SUMMARY_FIELDS, TIME_ANALYSIS_FIELDS,
+                         TournamentAggregator)
+from incremental_export import atomic_open
+from match_store import MATCH_FIELDS
+
+REPORT_FILE = 'TOURNAMENT_REPORT.xlsx'
+
+# Number formats by column; other columns keep Excel's General format
+NUMBER_FORMATS = {
+    'date': 'yyyy-mm-dd',
+    'attendance': '#,##0',
+    'total_attendance': '#,##0',
+    'avg_attendance': '#,##0',
+    'avg_goals_per_match': '0.00',
+    'avg_cards_per_match': '0.00',
+    'avg_match_time_minutes': '0.0',
+    'cards_per_goal': '0.00',
+}
+
+COLUMN_WIDTHS = {
+    'venue': 40, 'tournament': 18, 'home_team': 16, 'away_team': 16, 'winner': 16,
+    'match_id': 16, 'stage': 14, 'date': 12, 'penalty_result': 16,
+}
+
+_HEADER_FONT = Font(bold=True, color='FFFFFF')
+_HEADER_FILL = PatternFill('solid', start_color='1F4E78')
+
+
+class _SheetWriter:
+    """
+    A write-only worksheet with a styled, frozen header
+    writerow(dict) lets it stand in for a csv.DictWriter, e.g. as an aggregator sink
+    """
+
+    def __init__(self, workbook, title, fields):
+        self.sheet = workbook.create_sheet(title)
+        self.fields = fields
+        self.rows = 0
+        # Layout has to be in place before the first append in write-only mode
+        self.sheet.freeze_panes = 'A2'
+        for column, field in enumerate(fields, 1):
+            width = COLUMN_WIDTHS.get(field, max(10, len(field) + 2))
+            self.sheet.column_dimensions[get_column_letter(column)].width = width
+
+        header = []
+        for field in fields:
+            cell = WriteOnlyCell(self.sheet, value=field)
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            header.append(cell)
+        self.sheet.append(header)
+
+        # Only formatted columns pay for a styled cell per value
+        self._formats = [(i, NUMBER_FORMATS[f]) for i, f in enumerate(fields) if f in NUMBER_FORMATS]
+        self._date_columns = [i for i, f in enumerate(fields) if f == 'date']
+
+    def writerow(self, row):
+        values = [row.get(field) for field in self.fields]
+        for i in self._date_columns:
+            if isinstance(values[i], str):
+                values[i] = date.fromisoformat(values[i])
+        for i, number_format in self._formats:
+            if values[i] is not None:
+                cell = WriteOnlyCell(self.sheet, value=values[i])
+                cell.number_format = number_format
+                values[i] = cell
+        self.sheet.append(values)
+        self.rows += 1
+
+
+def write_excel_report(path, matches):
+    """
+    Stream matches into a four-sheet workbook at path
+    matches may be any iterable, e.g. streaming.iter_enriched_matches();
+    returns the summary statistics rows
+    """
+    workbook = Workbook(write_only=True)
+    # Sheets are created in display order; write-only sheets can be appended to in any order
+    match_sheet = _SheetWriter(workbook, 'Matches', MATCH_FIELDS)
+    summary_sheet = _SheetWriter(workbook, 'Summary', SUMMARY_FIELDS)
+    time_sheet = _SheetWriter(workbook, 'Time Analysis', TIME_ANALYSIS_FIELDS)
+    cards_sheet = _SheetWriter(workbook, 'Cards Analysis', CARDS_ANALYSIS_FIELDS)
+
+    with metrics.stage('write:excel'):
+        aggregator = TournamentAggregator(time_sheet, cards_sheet)
+        for match in matches:
+            match_sheet.writerow(match)
+            aggregator.add(match)
+
+        summary_stats = aggregator.summary_rows()
+        for row in summary_stats:
+            summary_sheet.writerow(row)
+
+        with atomic_open(path, 'wb') as f:
+            workbook.save(f)
+    metrics.record_write(os.path.basename(path), match_sheet.rows, os.path.getsize(path))
+    return summary_stats
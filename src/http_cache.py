@@ -0,0 +1,172 @@
+"""
+Persistent, size-bounded HTTP response cache for the tournament scraper
+Stores page bodies, validators (ETag / Last-Modified) and parsed rows on disk
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+
+from incremental_export import atomic_open
+
+INDEX_FILE = 'index.json'
+
+# Recency changes from lookups are written at most once per this many hits
+LOOKUP_SAVE_INTERVAL = 100
+# New entries are written to the index at most once per this many stores;
+# until then only the index lags (bodies are on disk), and flush() catches up
+STORE_SAVE_INTERVAL = 50
+
+
+class ResponseCache:
+    """On-disk LRU cache keyed by URL"""
+
+    def __init__(self, cache_dir='.http_cache', max_bytes=100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+        self.total_bytes = sum(entry['size'] for entry in self._index.values())
+        # Lookups and stores since the index was last written
+        self._unsaved_lookups = 0
+        self._unsaved_stores = 0
+
+    # Index bookkeeping ------------------------------------------------------
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, INDEX_FILE)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path()) as f:
+                # Entries are stored least recently used first
+                return OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            return OrderedDict()
+
+    def _save_index(self):
+        tmp_path = self._index_path() + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(list(self._index.items()), f)
+        os.replace(tmp_path, self._index_path())
+        self._unsaved_lookups = 0
+        self._unsaved_stores = 0
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + '.body', base + '.rows.json'
+
+    def _remove_files(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._index:
+            key, entry = self._index.popitem(last=False)
+            self._remove_files(key)
+            self.total_bytes -= entry['size']
+
+    # Public API -------------------------------------------------------------
+
+    def conditional_headers(self, url):
+        """Return If-None-Match / If-Modified-Since headers for a cached URL"""
+        with self._lock:
+            entry = self._index.get(self._key(url))
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def lookup(self, url):
+        """
+        Return (body, rows) for a cached URL and mark it recently used
+        rows is None if the page was cached without parsed data
+        """
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                return None
+            # Recency lives in memory; it reaches disk with the next store/flush or in batches
+            self._index.move_to_end(key)
+            self._unsaved_lookups += 1
+            if self._unsaved_lookups >= LOOKUP_SAVE_INTERVAL:
+                self._save_index()
+
+        body_path, rows_path = self._paths(key)
+        try:
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        try:
+            with open(rows_path) as f:
+                rows = json.load(f)
+        except (OSError, ValueError):
+            rows = None
+        return body, rows
+
+    def store(self, url, body, etag=None, last_modified=None, rows=None):
+        """Store a response body, its validators and optional parsed rows"""
+        key = self._key(url)
+        body_path, rows_path = self._paths(key)
+
+        # Files are replaced atomically outside the lock, so lookups never see a
+        # partial body and other threads are not held up by this one's disk I/O
+        with atomic_open(body_path, 'wb') as f:
+            f.write(body)
+        size = len(body)
+
+        if rows is not None:
+            with atomic_open(rows_path) as f:
+                json.dump(rows, f)
+            size += os.path.getsize(rows_path)
+        else:
+            try:
+                os.remove(rows_path)
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous['size']
+            self._index[key] = {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': size,
+            }
+            self.total_bytes += size
+            self._evict()
+            self._unsaved_stores += 1
+            if self._unsaved_stores >= STORE_SAVE_INTERVAL:
+                self._save_index()
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            for key in list(self._index):
+                self._remove_files(key)
+            self._index.clear()
+            self.total_bytes = 0
+            self._save_index()
+
+    def flush(self):
+        """Write index changes (new entries, LRU order) not saved yet"""
+        with self._lock:
+            if self._unsaved_lookups or self._unsaved_stores:
+                self._save_index()
@@ -0,0 +1,78 @@
+"""
+Incremental export support: content hashes, a manifest of what each output
+was built from, and atomic file writes
+"""
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import tempfile
+
+MANIFEST_FILE = '.export_manifest.json'
+
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def content_hash(obj):
+    """Stable SHA-256 of any JSON-serializable object"""
+    payload = json.dumps(obj, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@contextmanager
+def atomic_open(path, mode='w', **kwargs):
+    """
+    Open a temporary file next to path and rename it over path on success,
+    so readers only ever see the old or the complete new file
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.')
+    try:
+        # mkstemp creates owner-only files; give the result normal permissions
+        os.chmod(tmp_path, 0o666 & ~_current_umask())
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class ExportManifest:
+    """Records the input hash each output file was last built from"""
+
+    def __init__(self, output_dir, force=False):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_FILE)
+        self.force = force
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def is_current(self, artifact, input_hash):
+        """True if artifact exists and was built from input_hash"""
+        if self.force or self.entries.get(artifact) != input_hash:
+            return False
+        return os.path.exists(os.path.join(self.output_dir, artifact))
+
+    def record(self, artifact, input_hash):
+        self.entries[artifact] = input_hash
+
+    def forget(self, artifact):
+        """Drop an artifact that was rewritten outside the manifest, so it is rebuilt next time"""
+        self.entries.pop(artifact, None)
+
+    def save(self):
+        with atomic_open(self.path) as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
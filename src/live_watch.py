@@ -0,0 +1,226 @@
+"""
+Live watch mode for following matches in progress
+Each fixture URL is polled on its own adaptive schedule: every fast_interval
+seconds while one of its matches is near or in play, every slow_interval
+seconds otherwise, backing off exponentially after errors. Pages whose fixture
+tables hash the same as last time are skipped before any parsing, and only new
+or changed matches are emitted.
+
+    watcher = LiveWatcher(urls, on_change=lambda url, row: print(row))
+    asyncio.run(watcher.run())
+"""
+import asyncio
+from datetime import datetime, timedelta
+import hashlib
+import random
+import re
+
+import metrics
+from scraper import TournamentScraper
+
+# Poll fast from shortly before kick-off until well after the final whistle
+KICKOFF_LEAD = timedelta(minutes=15)
+MATCH_WINDOW = timedelta(minutes=150)
+
+# Column names that identify a match, matched case-insensitively
+KEY_COLUMNS = {
+    'date': ('date', 'match date'),
+    'home': ('home', 'home_team', 'home team'),
+    'away': ('away', 'away_team', 'away team'),
+}
+TIME_COLUMNS = ('time', 'kick-off', 'kickoff', 'ko')
+
+# Failures beyond this many no longer grow the backoff, so long outages cannot
+# overflow the float maths (max_backoff caps the delay long before)
+MAX_BACKOFF_EXPONENT = 16
+
+_TABLE_PATTERN = re.compile(rb'<table\b.*?</table\s*>', re.IGNORECASE | re.DOTALL)
+
+
+def fragment_hash(content, fixture_tables_only=True):
+    """
+    Hash of the page's <table> markup, so changes elsewhere (ads, timestamps) are ignored
+    Works on the raw bytes without building a tree
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    digest = hashlib.sha256()
+    if fixture_tables_only:
+        for table in _TABLE_PATTERN.findall(content):
+            digest.update(table)
+    else:
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def _column(row, names):
+    lowered = {key.lower(): value for key, value in row.items()}
+    for name in names:
+        if lowered.get(name):
+            return lowered[name]
+    return None
+
+
+def match_key(row):
+    """(date, home, away) for a scraped row; the whole row when those columns are missing"""
+    key = tuple(_column(row, names) for names in KEY_COLUMNS.values())
+    if None in key:
+        return tuple(sorted(row.items()))
+    return key
+
+
+def kickoff_time(row):
+    """Kick-off as a naive local datetime, or None when the row has no parseable date"""
+    date = _column(row, KEY_COLUMNS['date'])
+    if not date:
+        return None
+    time = _column(row, TIME_COLUMNS) or '00:00'
+    try:
+        return datetime.strptime(f'{date} {time}', '%Y-%m-%d %H:%M')
+    except ValueError:
+        return None
+
+
+class _WatchTarget:
+    """Polling state for one URL"""
+    __slots__ = ('url', 'fragment', 'rows', 'parsed_rows', 'kickoffs', 'failures')
+
+    def __init__(self, url):
+        self.url = url
+        self.fragment = None
+        self.rows = {}
+        # The page's rows exactly as parsed, for refreshing the cache entry
+        self.parsed_rows = []
+        self.kickoffs = []
+        self.failures = 0
+
+
+class LiveWatcher:
+    """
+    Poll fixture pages and report matches that changed since the last poll
+    Changes go to on_change(url, row) (a plain function or coroutine function)
+    and/or are put on queue as (url, row) tuples.
+    """
+
+    def __init__(self, urls, scraper=None, on_change=None, queue=None, fast_interval=30,
+                 slow_interval=600, max_backoff=1800, max_concurrent=None, now=datetime.now):
+        self.urls = list(urls)
+        self.scraper = scraper or TournamentScraper()
+        self.on_change = on_change
+        self.queue = queue
+        self.fast_interval = fast_interval
+        self.slow_interval = slow_interval
+        self.max_backoff = max_backoff
+        self.max_concurrent = max_concurrent or self.scraper.max_workers
+        self.now = now
+        self.targets = {url: _WatchTarget(url) for url in self.urls}
+        self._stopping = None
+
+    def next_interval(self, target):
+        """Seconds until target should be polled again"""
+        if target.failures:
+            delay = min(self.max_backoff,
+                        self.fast_interval * 2 ** min(target.failures, MAX_BACKOFF_EXPONENT))
+            # Jitter keeps many failing URLs from retrying in lockstep
+            return delay * random.uniform(0.8, 1.2)
+
+        now = self.now()
+        upcoming = None
+        for kickoff in target.kickoffs:
+            if kickoff - KICKOFF_LEAD <= now <= kickoff + MATCH_WINDOW:
+                return self.fast_interval
+            if kickoff - KICKOFF_LEAD > now:
+                start = (kickoff - KICKOFF_LEAD - now).total_seconds()
+                upcoming = start if upcoming is None else min(upcoming, start)
+        # Sleep slow, but wake in time for the next kick-off window
+        if upcoming is not None:
+            return max(self.fast_interval, min(self.slow_interval, upcoming))
+        return self.slow_interval
+
+    async def poll(self, target):
+        """Fetch target once and return the matches that changed"""
+        metrics.increment('watch_polls')
+        response, cached_rows = await asyncio.to_thread(self.scraper.fetch_page, target.url)
+        if cached_rows is not None:
+            # 304 from the cache revalidation: nothing changed upstream
+            metrics.increment('watch_unchanged')
+            if target.fragment is None:
+                # First poll against a warm cache: the cached rows are the baseline
+                return self._update(target, cached_rows)
+            return []
+
+        fragment = fragment_hash(response.content, self.scraper.fixture_tables_only)
+        if fragment == target.fragment:
+            metrics.increment('watch_unchanged')
+            # Keep the cached validators current so the next poll can be answered with a 304
+            await asyncio.to_thread(self.scraper.remember, target.url, response,
+                                    target.parsed_rows)
+            return []
+
+        rows = await asyncio.to_thread(self.scraper.parse_page, response.content)
+        await asyncio.to_thread(self.scraper.remember, target.url, response, rows)
+        target.fragment = fragment
+        return self._update(target, rows)
+
+    def _update(self, target, rows):
+        """Replace target's rows and kick-offs, returning the rows that are new or changed"""
+        current = {match_key(row): row for row in rows}
+        changed = [row for key, row in current.items() if target.rows.get(key) != row]
+        target.rows = current
+        target.parsed_rows = rows
+        target.kickoffs = sorted(k for k in map(kickoff_time, rows) if k is not None)
+        metrics.increment('watch_changes', len(changed))
+        return changed
+
+    async def _emit(self, url, row):
+        if self.on_change:
+            # The row is already committed to its target, so a failing callback must
+            # neither lose the rows after it nor count as a fetch failure
+            try:
+                result = self.on_change(url, row)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                metrics.increment('watch_callback_errors')
+                print(f"Error handling change from {url}: {e}")
+        if self.queue is not None:
+            await self.queue.put((url, row))
+
+    async def _watch(self, target, slots):
+        while not self._stopping.is_set():
+            try:
+                async with slots:
+                    changed = await self.poll(target)
+                target.failures = 0
+                for row in changed:
+                    await self._emit(target.url, row)
+            except Exception as e:
+                target.failures += 1
+                metrics.increment('scrape_errors')
+                print(f"Error watching {target.url}: {e}")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.next_interval(target))
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, duration=None):
+        """Watch until stop() is called, or for duration seconds"""
+        self._stopping = asyncio.Event()
+        slots = asyncio.Semaphore(self.max_concurrent)
+        tasks = [asyncio.create_task(self._watch(target, slots))
+                 for target in self.targets.values()]
+        try:
+            if duration is not None:
+                await asyncio.sleep(duration)
+                self.stop()
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if getattr(self.scraper, 'cache', None):
+                self.scraper.cache.flush()
+
+    def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
@@ -1,11 +1,17 @@
 """
 Main script to run the women's tournament scraper
 """
-from scraper import TournamentScraper
+from datetime import datetime
+import os
+import sys
+
+import metrics
 
 def main():
     print("Starting Women's Tournament Data Scraper...")
     
+    # Imported here so 'watch' and other entry points only pay for what they use
+    from scraper import TournamentScraper
     scraper = TournamentScraper()
     
     # Add your target URLs here
@@ -14,14 +20,40 @@ def main():
         # Add more URLs as needed
     ]
     
+    # Fetch every page concurrently; results come back in the same order as urls
     for url in urls:
         print(f"Scraping: {url}")
-        data = scraper.scrape_tournament_data(url)
-        
+    results = scraper.scrape_many(urls)
+    
+    for data in results:
         if data:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             filename = f"tournament_data_{timestamp}.csv"
             scraper.save_data(data, filename)
 
+def watch(urls):
+    """Follow live matches on urls, printing each match as it changes"""
+    import asyncio
+    from live_watch import LiveWatcher
+
+    def report(url, row):
+        print(f"🔄 {url}: {row}")
+
+    print(f"Watching {len(urls)} page(s) - Ctrl+C to stop")
+    try:
+        asyncio.run(LiveWatcher(urls, on_change=report).run())
+    except KeyboardInterrupt:
+        pass
+
 if __name__ == "__main__":
-    main()
+    # Set METRICS_REPORT=report.json (or report.prom) to write timing and I/O metrics
+    if os.environ.get('METRICS_REPORT'):
+        metrics.enable()
+    # Usage: main.py               one-shot scrape of the URLs listed in main()
+    #        main.py watch URL...  poll the pages and print matches as they change
+    if len(sys.argv) > 2 and sys.argv[1] == 'watch':
+        watch(sys.argv[2:])
+    else:
+        main()
+    if os.environ.get('METRICS_REPORT'):
+        metrics.write_report(os.environ['METRICS_REPORT'])
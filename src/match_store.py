@@ -0,0 +1,196 @@
+"""
+Indexed in-memory store of enhanced matches
+Matches are kept as __slots__ records sorted by date, with secondary indexes on
+team, venue, city, stage and tournament. Every index keeps its matches in date
+order, so filtered date-range queries cost O(log n + k).
+"""
+from bisect import bisect_left, bisect_right
+import csv
+import json
+import os
+import sys
+
+MATCH_FIELDS = [
+    'date', 'time', 'home_team', 'away_team', 'home_score', 'away_score', 'stage', 'venue',
+    'attendance', 'tournament', 'match_id', 'total_goals', 'yellow_cards', 'red_cards',
+    'total_cards', 'stoppage_time_first_half', 'stoppage_time_second_half',
+    'total_stoppage_time', 'total_match_time', 'had_extra_time', 'winner', 'day_of_week',
+    'match_week', 'penalty_result'
+]
+
+INT_FIELDS = {
+    'home_score', 'away_score', 'attendance', 'total_goals', 'yellow_cards', 'red_cards',
+    'total_cards', 'stoppage_time_first_half', 'stoppage_time_second_half',
+    'total_stoppage_time', 'total_match_time'
+}
+
+# Low-cardinality strings shared between records
+INTERNED_FIELDS = {
+    'time', 'home_team', 'away_team', 'stage', 'venue', 'tournament', 'winner',
+    'day_of_week', 'match_week'
+}
+
+
+class MatchRecord:
+    """One match with a fixed set of attributes"""
+    __slots__ = MATCH_FIELDS
+
+    def __init__(self, match):
+        for field in MATCH_FIELDS:
+            value = match.get(field)
+            if field in INTERNED_FIELDS and value is not None:
+                value = sys.intern(value)
+            setattr(self, field, value)
+
+    @property
+    def city(self):
+        """Venue city, e.g. 'Rabat' for 'Prince Moulay Abdellah Stadium, Rabat'"""
+        return self.venue.rsplit(',', 1)[-1].strip()
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in MATCH_FIELDS}
+
+    def __repr__(self):
+        return (f"MatchRecord({self.match_id}: {self.date} {self.home_team} "
+                f"{self.home_score}-{self.away_score} {self.away_team})")
+
+
+class _DateIndex:
+    """Record positions for one index key, with their dates kept alongside for bisecting"""
+    __slots__ = ('positions', 'dates')
+
+    def __init__(self):
+        self.positions = []
+        self.dates = []
+
+    def between(self, start=None, end=None):
+        lo = bisect_left(self.dates, start) if start is not None else 0
+        hi = bisect_right(self.dates, end) if end is not None else len(self.dates)
+        return self.positions[lo:hi]
+
+
+class MatchStore:
+    """Matches with secondary indexes for fast team/venue/stage/date lookups"""
+
+    INDEXES = ('team', 'venue', 'city', 'stage', 'tournament')
+
+    def __init__(self, matches=()):
+        self._records = []
+        self.extend(matches)
+
+    def extend(self, matches):
+        """Add matches and rebuild the indexes"""
+        records = self._records + [
+            m if isinstance(m, MatchRecord) else MatchRecord(m) for m in matches
+        ]
+        records.sort(key=lambda r: (r.date, r.time or '', r.match_id or ''))
+        self._records = records
+        self._build_indexes()
+
+    def _build_indexes(self):
+        self._all = _DateIndex()
+        self._indexes = {name: {} for name in self.INDEXES}
+
+        def add(name, key, position, date):
+            entry = self._indexes[name].get(key)
+            if entry is None:
+                entry = self._indexes[name][key] = _DateIndex()
+            entry.positions.append(position)
+            entry.dates.append(date)
+
+        # Records are date-sorted, so appending keeps every index in date order
+        for position, record in enumerate(self._records):
+            date = record.date
+            self._all.positions.append(position)
+            self._all.dates.append(date)
+            add('team', record.home_team, position, date)
+            add('team', record.away_team, position, date)
+            add('venue', record.venue, position, date)
+            add('city', record.city, position, date)
+            add('stage', record.stage, position, date)
+            add('tournament', record.tournament, position, date)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def keys(self, index):
+        """Distinct values of one index, e.g. store.keys('team')"""
+        return sorted(self._indexes[index])
+
+    def query(self, team=None, venue=None, city=None, stage=None, tournament=None,
+              start=None, end=None):
+        """
+        Matches meeting every given filter, in date order
+        start/end are inclusive ISO dates ('2025-07-05')
+        """
+        filters = {name: value for name, value in
+                   [('team', team), ('venue', venue), ('city', city), ('stage', stage),
+                    ('tournament', tournament)] if value is not None}
+
+        # Drive the lookup from the most selective index, then check the rest
+        candidates = self._all
+        for name, value in filters.items():
+            entry = self._indexes[name].get(value)
+            if entry is None:
+                return []
+            if len(entry.positions) < len(candidates.positions):
+                candidates = entry
+
+        records = [self._records[p] for p in candidates.between(start, end)]
+        if len(filters) > 1 or (filters and candidates is self._all):
+            records = [r for r in records if self._matches(r, filters)]
+        return records
+
+    @staticmethod
+    def _matches(record, filters):
+        for name, value in filters.items():
+            if name == 'team':
+                if value != record.home_team and value != record.away_team:
+                    return False
+            elif name == 'city':
+                if record.city != value:
+                    return False
+            elif getattr(record, name) != value:
+                return False
+        return True
+
+    def matches_for_team(self, team):
+        return self.query(team=team)
+
+    def between(self, start=None, end=None):
+        return self.query(start=start, end=end)
+
+    # Loading ----------------------------------------------------------------
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_csv(cls, path):
+        with open(path, newline='', encoding='utf-8') as f:
+            return cls(convert_csv_row(row) for row in csv.DictReader(f))
+
+    @classmethod
+    def from_enhanced_data(cls, directory='complete_enhanced_data'):
+        """Load the combined export, preferring the JSON version"""
+        json_path = os.path.join(directory, 'BOTH_TOURNAMENTS_COMPLETE_ENHANCED.json')
+        if os.path.exists(json_path):
+            return cls.from_json(json_path)
+        return cls.from_csv(os.path.join(directory, 'BOTH_TOURNAMENTS_COMPLETE_ENHANCED.csv'))
+
+
+def convert_csv_row(row):
+    """Restore the types pandas' CSV export flattened to text"""
+    match = dict(row)
+    for field in INT_FIELDS:
+        if match.get(field) not in (None, ''):
+            match[field] = int(float(match[field]))
+    match['had_extra_time'] = match.get('had_extra_time') == 'True'
+    if not match.get('penalty_result'):
+        match['penalty_result'] = None
+    return match
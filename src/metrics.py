@@ -0,0 +1,251 @@
+"""
+Lightweight instrumentation for the scrape/export pipeline
+Per-stage wall/CPU timers, HTTP request counters and latency histograms, and
+rows/bytes written per output file. Disabled by default: until enable() is
+called every hook is a no-op, so instrumented code costs one function call.
+
+    import metrics
+    metrics.enable()
+    ...run the pipeline...
+    print(metrics.to_json())          # or metrics.to_prometheus()
+"""
+from contextlib import contextmanager, nullcontext
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Upper bounds (seconds) of the HTTP latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+    """Thread-safe collector for one run"""
+
+    enabled = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.stages = {}
+        self.http = {}
+        self.outputs = {}
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - wall_start,
+                              time.thread_time() - cpu_start)
+
+    def record_stage(self, name, wall_seconds, cpu_seconds=0.0):
+        """Add one timed call of a stage (for work timed elsewhere, e.g. a worker process)"""
+        with self._lock:
+            stage = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+            stage['calls'] += 1
+            stage['wall_seconds'] += wall_seconds
+            stage['cpu_seconds'] += cpu_seconds
+
+    def record_http(self, url, status, nbytes, latency):
+        host = urlsplit(url).netloc
+        with self._lock:
+            entry = self.http.get(host)
+            if entry is None:
+                entry = self.http[host] = {
+                    'requests': 0, 'bytes': 0, 'status': {},
+                    'latency_buckets': [0] * (len(LATENCY_BUCKETS) + 1),
+                    'latency_sum': 0.0,
+                }
+            entry['requests'] += 1
+            entry['bytes'] += nbytes
+            entry['status'][str(status)] = entry['status'].get(str(status), 0) + 1
+            entry['latency_sum'] += latency
+            bucket = len(LATENCY_BUCKETS)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    bucket = i
+                    break
+            entry['latency_buckets'][bucket] += 1
+
+    def record_write(self, path, rows, nbytes):
+        with self._lock:
+            entry = self.outputs.setdefault(path, {'writes': 0, 'rows': 0, 'bytes': 0})
+            entry['writes'] += 1
+            entry['rows'] += rows
+            entry['bytes'] += nbytes
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self):
+        """Everything collected so far as a JSON-serializable dict"""
+        with self._lock:
+            http = {}
+            for host, entry in self.http.items():
+                http[host] = {
+                    'requests': entry['requests'],
+                    'bytes': entry['bytes'],
+                    'status': dict(entry['status']),
+                    'latency_seconds': {
+                        'sum': round(entry['latency_sum'], 6),
+                        'mean': round(entry['latency_sum'] / entry['requests'], 6),
+                        'buckets': {
+                            str(bound): count for bound, count in
+                            zip(LATENCY_BUCKETS + ('+Inf',), entry['latency_buckets'])
+                        },
+                    },
+                }
+            return {
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+                'elapsed_seconds': round(time.time() - self.started_at, 6),
+                'stages': {name: {key: round(value, 6) if isinstance(value, float) else value
+                                  for key, value in stage.items()}
+                           for name, stage in self.stages.items()},
+                'http': http,
+                'outputs': {path: dict(entry) for path, entry in self.outputs.items()},
+                'counters': dict(self.counters),
+            }
+
+    def to_prometheus(self):
+        """The report in Prometheus text exposition format"""
+        report = self.report()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in samples:
+                label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f'{name}{{{label_text}}} {value}' if label_text else f'{name} {value}')
+
+        stages = report['stages']
+        metric('tournament_stage_calls_total', 'counter', 'Timed calls per pipeline stage',
+               [({'stage': n}, s['calls']) for n, s in stages.items()])
+        metric('tournament_stage_wall_seconds_total', 'counter', 'Wall time per pipeline stage',
+               [({'stage': n}, s['wall_seconds']) for n, s in stages.items()])
+        metric('tournament_stage_cpu_seconds_total', 'counter', 'CPU time per pipeline stage',
+               [({'stage': n}, s['cpu_seconds']) for n, s in stages.items()])
+
+        http = report['http']
+        metric('tournament_http_requests_total', 'counter', 'HTTP responses by host and status',
+               [({'host': h, 'status': code}, n)
+                for h, e in http.items() for code, n in e['status'].items()])
+        metric('tournament_http_response_bytes_total', 'counter', 'HTTP body bytes by host',
+               [({'host': h}, e['bytes']) for h, e in http.items()])
+
+        histogram = []
+        for host, entry in http.items():
+            cumulative = 0
+            for bound, count in entry['latency_seconds']['buckets'].items():
+                cumulative += count
+                histogram.append(('_bucket', {'host': host, 'le': bound}, cumulative))
+            histogram.append(('_sum', {'host': host}, entry['latency_seconds']['sum']))
+            histogram.append(('_count', {'host': host}, entry['requests']))
+        name = 'tournament_http_request_duration_seconds'
+        lines.append(f'# HELP {name} HTTP request latency by host')
+        lines.append(f'# TYPE {name} histogram')
+        for suffix, labels, value in histogram:
+            label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f'{name}{suffix}{{{label_text}}} {value}')
+
+        outputs = report['outputs']
+        metric('tournament_output_rows_total', 'counter', 'Rows written per output file',
+               [({'file': p}, e['rows']) for p, e in outputs.items()])
+        metric('tournament_output_bytes_total', 'counter', 'Bytes written per output file',
+               [({'file': p}, e['bytes']) for p, e in outputs.items()])
+        metric('tournament_events_total', 'counter', 'Named event counters',
+               [({'name': n}, v) for n, v in report['counters'].items()])
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _DisabledMetrics:
+    """Stand-in used while instrumentation is off; every hook does nothing"""
+
+    enabled = False
+    _null_stage = nullcontext()
+
+    def stage(self, name):
+        return self._null_stage
+
+    def record_stage(self, name, wall_seconds, cpu_seconds=0.0):
+        pass
+
+    def record_http(self, url, status, nbytes, latency):
+        pass
+
+    def record_write(self, path, rows, nbytes):
+        pass
+
+    def increment(self, name, amount=1):
+        pass
+
+
+_DISABLED = _DisabledMetrics()
+_active = _DISABLED
+
+
+def enable():
+    """Start collecting into a fresh Metrics object and return it"""
+    global _active
+    _active = Metrics()
+    return _active
+
+
+def disable():
+    global _active
+    _active = _DISABLED
+
+
+def is_enabled():
+    return _active.enabled
+
+
+def current():
+    """The active collector (a no-op stand-in when disabled)"""
+    return _active
+
+
+# Module-level hooks used by the instrumented code
+
+def stage(name):
+    return _active.stage(name)
+
+
+def record_stage(name, wall_seconds, cpu_seconds=0.0):
+    _active.record_stage(name, wall_seconds, cpu_seconds)
+
+
+def record_http(url, status, nbytes, latency):
+    _active.record_http(url, status, nbytes, latency)
+
+
+def record_write(path, rows, nbytes):
+    _active.record_write(path, rows, nbytes)
+
+
+def increment(name, amount=1):
+    _active.increment(name, amount)
+
+
+def to_json(indent=2):
+    return json.dumps(_active.report() if _active.enabled else {}, indent=indent)
+
+
+def to_prometheus():
+    return _active.to_prometheus() if _active.enabled else ''
+
+
+def write_report(path):
+    """Write the report to path: Prometheus text for *.prom, JSON otherwise"""
+    text = to_prometheus() if path.endswith('.prom') else to_json()
+    with open(path, 'w') as f:
+        f.write(text)
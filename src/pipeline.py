@@ -0,0 +1,159 @@
+"""
+Staged fetch -> parse -> write pipeline for large scrape jobs
+Network I/O runs on threads, HTML parsing runs in a process pool and a single
+writer collects the rows. Bounded queues between the stages apply backpressure.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import queue
+import threading
+import time
+
+import metrics
+from scraper import TournamentScraper, parse_tournament_page
+
+_DONE = object()
+
+# How often blocked stages check whether the pipeline was cancelled
+CANCEL_POLL_SECONDS = 0.1
+
+
+def _put(q, item, cancel):
+    """Put item on a bounded queue; False if the pipeline was cancelled while waiting"""
+    while not cancel.is_set():
+        try:
+            q.put(item, timeout=CANCEL_POLL_SECONDS)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _timed_parse(content, parser, fixture_tables_only):
+    """Parse in a worker process and report how long it took there"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    rows = parse_tournament_page(content, parser, fixture_tables_only)
+    return rows, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def _fetch_stage(scraper, urls, fetched, fetch_workers, cancel):
+    """Fetch every URL on a thread pool, blocking while the parse stage is backed up"""
+
+    def fetch(item):
+        if cancel.is_set():
+            return
+        index, url = item
+        try:
+            response, rows = scraper.fetch_page(url)
+        except Exception as e:
+            metrics.increment('scrape_errors')
+            print(f"Error scraping {url}: {e}")
+            response, rows = None, []
+        _put(fetched, (index, url, response, rows), cancel)
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+        list(executor.map(fetch, enumerate(urls)))
+    _put(fetched, _DONE, cancel)
+
+
+def _parse_stage(fetched, parsed, pool, in_flight, parser, fixture_tables_only, cancel):
+    """Hand fetched pages to the process pool; cached pages skip straight to the writer"""
+    while not cancel.is_set():
+        try:
+            item = fetched.get(timeout=CANCEL_POLL_SECONDS)
+        except queue.Empty:
+            continue
+        if item is _DONE:
+            break
+
+        index, url, response, rows = item
+        if rows is not None:
+            _put(parsed, (index, url, None, rows), cancel)
+            continue
+
+        while not in_flight.acquire(timeout=CANCEL_POLL_SECONDS):
+            if cancel.is_set():
+                return
+        try:
+            future = pool.submit(_timed_parse, response.content, parser, fixture_tables_only)
+        except RuntimeError:
+            # The pool was shut down because the writer stage gave up
+            in_flight.release()
+            return
+
+        def on_done(future, index=index, url=url, response=response):
+            try:
+                rows, wall_seconds, cpu_seconds = future.result()
+                metrics.record_stage('parse', wall_seconds, cpu_seconds)
+            except Exception as e:
+                metrics.increment('parse_errors')
+                print(f"Error parsing {url}: {e}")
+                rows, response = [], None
+            in_flight.release()
+            _put(parsed, (index, url, response, rows), cancel)
+
+        future.add_done_callback(on_done)
+
+
+def run_pipeline(urls, scraper=None, fetch_workers=8, parse_workers=None, queue_size=32,
+                 on_rows=None):
+    """
+    Scrape urls through the staged pipeline
+    Returns one row list per URL in input order; on_rows(url, rows) is called
+    from the writer stage as each page finishes
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    scraper = scraper or TournamentScraper(max_workers=fetch_workers)
+    parse_workers = parse_workers or os.cpu_count() or 1
+
+    fetched = queue.Queue(maxsize=queue_size)
+    # Room for every in-flight parse so completion callbacks never block
+    parsed = queue.Queue(maxsize=queue_size + parse_workers * 2)
+    in_flight = threading.BoundedSemaphore(parse_workers * 2)
+
+    results = [None] * len(urls)
+    # Set when the writer stage stops, so the other stages stop waiting on it
+    cancel = threading.Event()
+    pool = ProcessPoolExecutor(max_workers=parse_workers)
+    try:
+        fetcher = threading.Thread(
+            target=_fetch_stage, args=(scraper, urls, fetched, fetch_workers, cancel), daemon=True
+        )
+        dispatcher = threading.Thread(
+            target=_parse_stage,
+            args=(fetched, parsed, pool, in_flight, scraper.parser, scraper.fixture_tables_only,
+                  cancel),
+            daemon=True,
+        )
+        fetcher.start()
+        dispatcher.start()
+
+        # Writer stage: the only place results, the cache and on_rows are touched
+        for _ in urls:
+            index, url, response, rows = parsed.get()
+            with metrics.stage('write'):
+                scraper.remember(url, response, rows)
+                results[index] = rows
+                if on_rows:
+                    on_rows(url, rows)
+
+        fetcher.join()
+        dispatcher.join()
+    finally:
+        # After a writer error nothing reads the queues any more: unblock the
+        # fetch workers and drop queued parses so the interpreter can exit
+        cancel.set()
+        while True:
+            try:
+                fetched.get_nowait()
+            except queue.Empty:
+                break
+        pool.shutdown(cancel_futures=True)
+
+    if scraper.cache:
+        scraper.cache.flush()
+    return results
@@ -0,0 +1,237 @@
+"""
+Elo team ratings over the match history
+Ratings live in a NumPy array indexed by integer team id. Matches are applied in
+(date, time) order with a goal-difference multiplier and a stage weight;
+shoot-outs count as draws. New results can be appended without a rebuild, and
+ratings as of any date come from cached per-date snapshots.
+
+    engine = RatingEngine(matches)
+    engine.rating('Spain')                       # current rating
+    engine.snapshot('2025-07-10')                # {team: rating} after that day
+"""
+from bisect import bisect_right
+
+import numpy as np
+
+BASE_RATING = 1500.0
+K_FACTOR = 40.0
+
+# Multiplier on K by stage; every 'Group X' stage uses the 'Group' weight
+STAGE_WEIGHTS = {
+    'Group': 1.0,
+    'Round of 16': 1.25,
+    'Quarter-final': 1.25,
+    'Semi-final': 1.5,
+    '3rd Place': 1.0,
+    'Final': 1.75,
+}
+
+# A full ratings array is kept every SNAPSHOT_STRIDE dates; any other date is
+# rebuilt from the checkpoint before it plus at most that many dates of changes
+SNAPSHOT_STRIDE = 32
+
+
+def stage_weight(stage):
+    if stage.startswith('Group'):
+        return STAGE_WEIGHTS['Group']
+    return STAGE_WEIGHTS.get(stage, 1.0)
+
+
+def goal_difference_multiplier(goal_difference):
+    """World Football Elo scaling: 1 for a one-goal margin, 1.5 for two, (11 + gd) / 8 beyond"""
+    gd = np.abs(goal_difference)
+    return np.where(gd <= 1, 1.0, np.where(gd == 2, 1.5, (11 + gd) / 8))
+
+
+def _play_order(home, away, n_teams):
+    """
+    Split matches (already in date order) into rounds in which no team plays twice
+    A match joins the round after both teams' previous matches, so processing the
+    rounds in turn gives the same ratings as going match by match
+    """
+    next_round = [0] * n_teams
+    rounds = []
+    for h, a in zip(home.tolist(), away.tolist()):
+        r = max(next_round[h], next_round[a])
+        rounds.append(r)
+        next_round[h] = next_round[a] = r + 1
+    rounds = np.array(rounds, dtype=np.int64)
+    order = np.argsort(rounds, kind='stable')
+    boundaries = np.flatnonzero(np.diff(rounds[order])) + 1
+    return np.split(order, boundaries)
+
+
+class RatingEngine:
+    """Elo ratings built from a list of match dicts (fixtures or enhanced matches)"""
+
+    def __init__(self, matches=(), k_factor=K_FACTOR, base_rating=BASE_RATING):
+        self.k_factor = k_factor
+        self.base_rating = base_rating
+        self.rebuild(matches)
+
+    # Building -------------------------------------------------------------
+
+    def rebuild(self, matches):
+        """Recompute every rating from scratch"""
+        self.teams = []
+        self.team_ids = {}
+        self.matches = []
+        self.dates = []
+        self.ratings = np.empty(0)
+        # Per processed match, in play order
+        self._home = np.empty(0, dtype=np.int64)
+        self._away = np.empty(0, dtype=np.int64)
+        self._date_index = np.empty(0, dtype=np.int64)
+        self._delta = np.empty(0)
+        # _checkpoints[k] holds the ratings before date index k * SNAPSHOT_STRIDE
+        self._checkpoints = []
+        self._snapshots = {}
+        self._apply(matches)
+        return self
+
+    def add_matches(self, matches):
+        """
+        Apply new results on top of the current ratings
+        Falls back to a full rebuild when a new match is dated before the last one applied
+        """
+        matches = list(matches)
+        if not matches:
+            return self
+        if self.dates and min(self._sort_key(m) for m in matches) < self._sort_key(self.matches[-1]):
+            return self.rebuild(self.matches + matches)
+        self._apply(matches)
+        return self
+
+    @staticmethod
+    def _sort_key(match):
+        return (match['date'], match.get('time') or '', match.get('match_id') or '')
+
+    def _team_id(self, team):
+        team_id = self.team_ids.get(team)
+        if team_id is None:
+            team_id = self.team_ids[team] = len(self.teams)
+            self.teams.append(team)
+        return team_id
+
+    def _apply(self, matches):
+        matches = sorted(matches, key=self._sort_key)
+        if not matches:
+            return
+        first_new_date = len(self.dates)
+        if self.dates and matches[0]['date'] == self.dates[-1]:
+            first_new_date -= 1
+
+        home = np.array([self._team_id(m['home_team']) for m in matches], dtype=np.int64)
+        away = np.array([self._team_id(m['away_team']) for m in matches], dtype=np.int64)
+        self.ratings = np.concatenate([
+            self.ratings, np.full(len(self.teams) - len(self.ratings), self.base_rating)
+        ])
+
+        # Everything except the ratings themselves is computed for all matches at once
+        home_score = np.array([m['home_score'] for m in matches])
+        away_score = np.array([m['away_score'] for m in matches])
+        shootout = np.array([bool(m.get('penalty_result')) for m in matches])
+        goal_difference = np.where(shootout, 0, home_score - away_score)
+        result = np.where(goal_difference > 0, 1.0, np.where(goal_difference < 0, 0.0, 0.5))
+        k = (self.k_factor * np.array([stage_weight(m['stage']) for m in matches])
+             * goal_difference_multiplier(goal_difference))
+
+        delta = np.empty(len(matches))
+        ratings = self.ratings
+        for batch in _play_order(home, away, len(self.teams)):
+            h, a = home[batch], away[batch]
+            expected = 1.0 / (1.0 + 10.0 ** ((ratings[a] - ratings[h]) / 400.0))
+            change = k[batch] * (result[batch] - expected)
+            # No team repeats within a batch, so fancy-index assignment is safe
+            ratings[h] += change
+            ratings[a] -= change
+            delta[batch] = change
+
+        for m in matches:
+            if not self.dates or self.dates[-1] != m['date']:
+                self.dates.append(m['date'])
+        date_lookup = {date: i for i, date in enumerate(self.dates[first_new_date:], first_new_date)}
+        date_index = np.array([date_lookup[m['date']] for m in matches], dtype=np.int64)
+
+        self.matches += matches
+        self._home = np.concatenate([self._home, home])
+        self._away = np.concatenate([self._away, away])
+        self._date_index = np.concatenate([self._date_index, date_index])
+        self._delta = np.concatenate([self._delta, delta])
+
+        # Snapshots from the first touched date on are stale, as are checkpoints after it
+        self._snapshots = {d: s for d, s in self._snapshots.items() if d < first_new_date}
+        del self._checkpoints[first_new_date // SNAPSHOT_STRIDE + 1:]
+        self._extend_checkpoints()
+
+    def _extend_checkpoints(self):
+        if not self._checkpoints:
+            self._checkpoints.append(np.empty(0))
+        while len(self._checkpoints) * SNAPSHOT_STRIDE < len(self.dates):
+            k = len(self._checkpoints)
+            self._checkpoints.append(
+                self._replay(k - 1, (k - 1) * SNAPSHOT_STRIDE, k * SNAPSHOT_STRIDE)
+            )
+
+    def _replay(self, checkpoint, start, stop):
+        """Ratings from checkpoint plus every change on date indexes [start, stop)"""
+        ratings = np.full(len(self.teams), self.base_rating)
+        base = self._checkpoints[checkpoint]
+        ratings[:len(base)] = base
+        lo, hi = np.searchsorted(self._date_index, [start, stop])
+        np.add.at(ratings, self._home[lo:hi], self._delta[lo:hi])
+        np.add.at(ratings, self._away[lo:hi], -self._delta[lo:hi])
+        return ratings
+
+    # Queries --------------------------------------------------------------
+
+    def ratings_as_of(self, date):
+        """
+        Ratings array (by team id) after every match on or before date
+        Repeated queries for a date are served from the snapshot cache
+        """
+        index = bisect_right(self.dates, date) - 1
+        if index < 0:
+            return np.full(len(self.teams), self.base_rating)
+        snapshot = self._snapshots.get(index)
+        if snapshot is None:
+            checkpoint = index // SNAPSHOT_STRIDE
+            snapshot = self._replay(checkpoint, checkpoint * SNAPSHOT_STRIDE, index + 1)
+            snapshot.setflags(write=False)
+            self._snapshots[index] = snapshot
+        if len(snapshot) < len(self.teams):
+            # Teams first seen later still had the base rating on that date
+            snapshot = np.concatenate([
+                snapshot, np.full(len(self.teams) - len(snapshot), self.base_rating)
+            ])
+        return snapshot
+
+    def rating(self, team, as_of=None):
+        """A team's rating now, or after every match on or before as_of"""
+        ratings = self.ratings if as_of is None else self.ratings_as_of(as_of)
+        return float(ratings[self.team_ids[team]])
+
+    def snapshot(self, as_of=None):
+        """{team: rating}, current or as of a date"""
+        ratings = self.ratings if as_of is None else self.ratings_as_of(as_of)
+        return dict(zip(self.teams, ratings.tolist()))
+
+    def table(self, as_of=None):
+        """(team, rating) pairs, best first"""
+        return sorted(self.snapshot(as_of).items(), key=lambda item: item[1], reverse=True)
+
+    def expected_score(self, home_team, away_team, as_of=None):
+        """Probability-like expected result for home_team against away_team"""
+        ratings = self.ratings if as_of is None else self.ratings_as_of(as_of)
+        diff = ratings[self.team_ids[away_team]] - ratings[self.team_ids[home_team]]
+        return float(1.0 / (1.0 + 10.0 ** (diff / 400.0)))
+
+
+if __name__ == "__main__":
+    from tournament_registry import REGISTRY
+
+    fixtures = [f for name in REGISTRY.names() for f in REGISTRY.fixtures(name)]
+    engine = RatingEngine(fixtures)
+    print("📈 Elo ratings after every tournament match")
+    for team, rating in engine.table()[:10]:
+        print(f"  {team:<14} {rating:7.1f}")
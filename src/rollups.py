@@ -0,0 +1,332 @@
+"""
+Materialized team, venue and head-to-head rollups
+Each match's contribution is remembered by match_id, so adding, correcting or
+removing a match touches only its two teams, its venue and its pair. Derived
+rows (averages, ratios) are built on first read and cached until one of their
+inputs changes. The whole store persists as JSON next to the other exports.
+
+    rollups = RollupStore(all_matches)
+    rollups.team('Spain')['goals_per_match']
+    rollups.head_to_head('England', 'Sweden')
+"""
+import json
+import os
+
+from incremental_export import atomic_open
+
+ROLLUPS_FILE = 'ROLLUPS.json'
+FORMAT_VERSION = 1
+
+
+def _ratio(numerator, denominator, digits=2):
+    return round(numerator / denominator, digits) if denominator else 0
+
+
+class TeamRollup:
+    """Totals for one team across every applied match"""
+    __slots__ = ('team', 'played', 'won', 'drawn', 'lost', 'goals_for', 'goals_against',
+                 'yellow_cards', 'red_cards', 'attendance', 'attended_matches', 'minutes')
+
+    def __init__(self, team):
+        self.team = team
+        self.played = self.won = self.drawn = self.lost = 0
+        self.goals_for = self.goals_against = 0
+        self.yellow_cards = self.red_cards = 0
+        self.attendance = self.attended_matches = self.minutes = 0
+
+    def _apply(self, scored, conceded, yellow_cards, red_cards, attendance, minutes, sign):
+        self.played += sign
+        self.goals_for += sign * scored
+        self.goals_against += sign * conceded
+        self.yellow_cards += sign * yellow_cards
+        self.red_cards += sign * red_cards
+        self.minutes += sign * minutes
+        if attendance is not None:
+            self.attendance += sign * attendance
+            self.attended_matches += sign
+        if scored > conceded:
+            self.won += sign
+        elif scored < conceded:
+            self.lost += sign
+        else:
+            self.drawn += sign
+
+    def to_dict(self):
+        cards = self.yellow_cards + self.red_cards
+        return {
+            'team': self.team,
+            'played': self.played,
+            'won': self.won,
+            'drawn': self.drawn,
+            'lost': self.lost,
+            'goals_for': self.goals_for,
+            'goals_against': self.goals_against,
+            'goal_difference': self.goals_for - self.goals_against,
+            'goals_per_match': _ratio(self.goals_for, self.played),
+            'yellow_cards': self.yellow_cards,
+            'red_cards': self.red_cards,
+            'cards_per_match': _ratio(cards, self.played),
+            'total_attendance': self.attendance,
+            'avg_attendance': _ratio(self.attendance, self.attended_matches, 0),
+            'avg_match_time_minutes': _ratio(self.minutes, self.played, 1),
+        }
+
+
+class VenueRollup:
+    """Totals for one venue"""
+    __slots__ = ('venue', 'played', 'goals', 'yellow_cards', 'red_cards', 'attendance',
+                 'attended_matches', 'minutes')
+
+    def __init__(self, venue):
+        self.venue = venue
+        self.played = self.goals = self.yellow_cards = self.red_cards = 0
+        self.attendance = self.attended_matches = self.minutes = 0
+
+    def _apply(self, goals, yellow_cards, red_cards, attendance, minutes, sign):
+        self.played += sign
+        self.goals += sign * goals
+        self.yellow_cards += sign * yellow_cards
+        self.red_cards += sign * red_cards
+        self.minutes += sign * minutes
+        if attendance is not None:
+            self.attendance += sign * attendance
+            self.attended_matches += sign
+
+    def to_dict(self):
+        return {
+            'venue': self.venue,
+            'city': self.venue.rsplit(',', 1)[-1].strip(),
+            'played': self.played,
+            'goals': self.goals,
+            'goals_per_match': _ratio(self.goals, self.played),
+            'yellow_cards': self.yellow_cards,
+            'red_cards': self.red_cards,
+            'cards_per_match': _ratio(self.yellow_cards + self.red_cards, self.played),
+            'total_attendance': self.attendance,
+            'avg_attendance': _ratio(self.attendance, self.attended_matches, 0),
+            'avg_match_time_minutes': _ratio(self.minutes, self.played, 1),
+        }
+
+
+class PairRollup:
+    """Head-to-head record of two teams; team_a sorts before team_b"""
+    __slots__ = ('team_a', 'team_b', 'played', 'a_wins', 'b_wins', 'draws', 'a_goals',
+                 'b_goals', 'cards')
+
+    def __init__(self, team_a, team_b):
+        self.team_a = team_a
+        self.team_b = team_b
+        self.played = self.a_wins = self.b_wins = self.draws = 0
+        self.a_goals = self.b_goals = self.cards = 0
+
+    def _apply(self, a_goals, b_goals, cards, sign):
+        self.played += sign
+        self.a_goals += sign * a_goals
+        self.b_goals += sign * b_goals
+        self.cards += sign * cards
+        if a_goals > b_goals:
+            self.a_wins += sign
+        elif a_goals < b_goals:
+            self.b_wins += sign
+        else:
+            self.draws += sign
+
+    def to_dict(self):
+        return {
+            'team_a': self.team_a,
+            'team_b': self.team_b,
+            'played': self.played,
+            'team_a_wins': self.a_wins,
+            'team_b_wins': self.b_wins,
+            'draws': self.draws,
+            'team_a_goals': self.a_goals,
+            'team_b_goals': self.b_goals,
+            'cards_per_match': _ratio(self.cards, self.played),
+        }
+
+
+def _pair_key(team, other):
+    return (team, other) if team <= other else (other, team)
+
+
+def _contribution(match):
+    """
+    What one match adds to the rollups, as plain JSON-friendly values
+    Cards use per-team fields when the data has them (home_yellow_cards, ...);
+    otherwise the match totals count for both teams, as in the standings
+    """
+    cards = {}
+    for side in ('home', 'away'):
+        cards[side] = [match.get(f'{side}_yellow_cards', match['yellow_cards']),
+                       match.get(f'{side}_red_cards', match['red_cards'])]
+    return [match['home_team'], match['away_team'], match.get('venue'),
+            match['home_score'], match['away_score'], cards['home'], cards['away'],
+            match['yellow_cards'], match['red_cards'], match.get('attendance'),
+            match['total_match_time']]
+
+
+class RollupStore:
+    """Per-team, per-venue and per-pair aggregates kept current one match at a time"""
+
+    KINDS = ('team', 'venue', 'pair')
+
+    def __init__(self, matches=()):
+        self._rollups = {kind: {} for kind in self.KINDS}
+        self._applied = {}
+        # Derived rows and sorted listings, dropped whenever their inputs change
+        self._rows = {}
+        self._listings = {}
+        for match in matches:
+            self.apply_match(match)
+
+    def _rollup(self, kind, key, factory):
+        rollup = self._rollups[kind].get(key)
+        if rollup is None:
+            rollup = self._rollups[kind][key] = factory()
+        return rollup
+
+    def _invalidate(self, kind, key):
+        self._rows.pop((kind, key), None)
+        self._listings.pop(kind, None)
+        rollup = self._rollups[kind].get(key)
+        if rollup is not None and rollup.played == 0:
+            del self._rollups[kind][key]
+
+    def _apply(self, contribution, sign):
+        (home, away, venue, home_score, away_score, home_cards, away_cards,
+         yellow_cards, red_cards, attendance, minutes) = contribution
+
+        self._rollup('team', home, lambda: TeamRollup(home))._apply(
+            home_score, away_score, *home_cards, attendance, minutes, sign)
+        self._rollup('team', away, lambda: TeamRollup(away))._apply(
+            away_score, home_score, *away_cards, attendance, minutes, sign)
+        self._invalidate('team', home)
+        self._invalidate('team', away)
+
+        if venue is not None:
+            self._rollup('venue', venue, lambda: VenueRollup(venue))._apply(
+                home_score + away_score, yellow_cards, red_cards, attendance, minutes, sign)
+            self._invalidate('venue', venue)
+
+        pair = _pair_key(home, away)
+        a_goals, b_goals = (home_score, away_score) if pair[0] == home else (away_score, home_score)
+        self._rollup('pair', pair, lambda: PairRollup(*pair))._apply(
+            a_goals, b_goals, yellow_cards + red_cards, sign)
+        self._invalidate('pair', pair)
+
+    def apply_match(self, match):
+        """
+        Add a new or corrected match
+        A match_id seen before is backed out first, so corrections simply re-send the match
+        """
+        match_id = match['match_id']
+        previous = self._applied.pop(match_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        contribution = _contribution(match)
+        self._apply(contribution, +1)
+        self._applied[match_id] = contribution
+
+    def remove_match(self, match_id):
+        """Back out a previously applied match (e.g. an annulled result)"""
+        previous = self._applied.pop(match_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+
+    def sync(self, matches):
+        """
+        Make the store reflect exactly matches, touching only what differs
+        Matches whose contribution is unchanged are skipped, new or corrected ones
+        are applied and match_ids that are gone are backed out. Returns the number
+        of match_ids touched.
+        """
+        current = set()
+        touched = 0
+        for match in matches:
+            match_id = match['match_id']
+            current.add(match_id)
+            if self._applied.get(match_id) != _contribution(match):
+                self.apply_match(match)
+                touched += 1
+        for match_id in [match_id for match_id in self._applied if match_id not in current]:
+            self.remove_match(match_id)
+            touched += 1
+        return touched
+
+    def __len__(self):
+        return len(self._applied)
+
+    # Queries --------------------------------------------------------------
+
+    def _row(self, kind, key):
+        row = self._rows.get((kind, key))
+        if row is None:
+            rollup = self._rollups[kind].get(key)
+            if rollup is None:
+                return None
+            row = self._rows[(kind, key)] = rollup.to_dict()
+        return row
+
+    def team(self, team):
+        """Totals and averages for one team, or None if it has no matches"""
+        return self._row('team', team)
+
+    def venue(self, venue):
+        return self._row('venue', venue)
+
+    def head_to_head(self, team, other):
+        """Record of team against other, from team's side; None if they never met"""
+        pair = _pair_key(team, other)
+        row = self._row('pair', pair)
+        if row is None or pair[0] == team:
+            return row
+        return {
+            'team_a': row['team_b'], 'team_b': row['team_a'], 'played': row['played'],
+            'team_a_wins': row['team_b_wins'], 'team_b_wins': row['team_a_wins'],
+            'draws': row['draws'], 'team_a_goals': row['team_b_goals'],
+            'team_b_goals': row['team_a_goals'], 'cards_per_match': row['cards_per_match'],
+        }
+
+    def rows(self, kind):
+        """Every row of one kind ('team', 'venue' or 'pair'), sorted by key"""
+        listing = self._listings.get(kind)
+        if listing is None:
+            listing = self._listings[kind] = [self._row(kind, key)
+                                              for key in sorted(self._rollups[kind])]
+        return listing
+
+    # Persistence ----------------------------------------------------------
+
+    def to_dict(self):
+        """Materialized rows for readers, plus the per-match contributions to rebuild from"""
+        return {
+            'version': FORMAT_VERSION,
+            'teams': self.rows('team'),
+            'venues': self.rows('venue'),
+            'head_to_head': self.rows('pair'),
+            'contributions': self._applied,
+        }
+
+    def dump(self, f):
+        json.dump(self.to_dict(), f, indent=2)
+
+    def save(self, path):
+        with atomic_open(path) as f:
+            self.dump(f)
+
+    @classmethod
+    def load(cls, path):
+        """Restore a saved store; aggregates are re-summed from the stored contributions"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported rollups format: {data.get('version')}")
+        store = cls()
+        for match_id, contribution in data['contributions'].items():
+            store._apply(contribution, +1)
+            store._applied[match_id] = contribution
+        return store
+
+    @classmethod
+    def from_enhanced_data(cls, directory='complete_enhanced_data'):
+        return cls.load(os.path.join(directory, ROLLUPS_FILE))
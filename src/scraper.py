@@ -2,42 +2,213 @@
 Women's Tournament Web Scraper
 """
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from datetime import datetime
 import os
+import threading
+import time
+
+from http_cache import ResponseCache
+import metrics
+
+
+def fixture_table_strainer():
+    """Only keep <table> elements, where fixture lists live"""
+    return SoupStrainer('table')
+
+
+def extract_fixture_rows(soup):
+    """
+    Turn every table in the soup into row dicts keyed by its header cells
+    """
+    data = []
+    for table in soup.find_all('table'):
+        header = None
+        for tr in table.find_all('tr'):
+            header_cells = tr.find_all('th')
+            if header_cells and header is None:
+                header = [cell.get_text(strip=True) for cell in header_cells]
+                continue
+
+            cells = [cell.get_text(strip=True) for cell in tr.find_all('td')]
+            if not cells:
+                continue
+            keys = header or [f'column_{i + 1}' for i in range(len(cells))]
+            data.append(dict(zip(keys, cells)))
+    return data
+
+
+def parse_tournament_page(content, parser='lxml', fixture_tables_only=True):
+    """
+    Parse a page body and extract its fixture rows
+    Module-level so it can run in a worker process
+    """
+    parse_only = fixture_table_strainer() if fixture_tables_only else None
+    soup = BeautifulSoup(content, parser, parse_only=parse_only)
+    return extract_fixture_rows(soup)
+
+
+class HostThrottle:
+    """Per-host concurrency cap and minimum spacing between requests"""
+
+    def __init__(self, max_concurrent=2, requests_per_second=None):
+        self.max_concurrent = max_concurrent
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._next_request_at = {}
+
+    def _slot(self, host):
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.max_concurrent)
+            return self._slots[host]
+
+    def _wait_for_turn(self, host):
+        # Reserve the next free start time for this host, then sleep until it
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = start_at + self.min_interval
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self, url, func):
+        """Call func() once a slot and a rate-limit turn are free for url's host"""
+        host = urlsplit(url).netloc
+        with self._slot(host):
+            if self.min_interval:
+                self._wait_for_turn(host)
+            return func()
+
 
 class TournamentScraper:
-    def __init__(self):
+    def __init__(self, max_workers=8, per_host_limit=2, per_host_rate=None, timeout=30,
+                 cache_dir=None, cache_max_bytes=100 * 1024 * 1024,
+                 parser='lxml', fixture_tables_only=True):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.parser = parser
+        self.fixture_tables_only = fixture_tables_only
+        self.throttle = HostThrottle(per_host_limit, per_host_rate)
+        # Conditional revalidation is only used when a cache directory is given
+        self.cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-    
+        # Keep one pooled connection per worker so threads never queue on the pool
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _get(self, url, headers=None):
+        """
+        Throttled GET, timed per request for the metrics report
+        Only the request itself is timed, not waits for a host slot or rate-limit turn;
+        requests that raise are recorded with status 'error'
+        """
+        def request():
+            with metrics.stage('fetch'):
+                started = time.perf_counter()
+                try:
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
+                except Exception:
+                    metrics.record_http(url, 'error', 0, time.perf_counter() - started)
+                    raise
+                metrics.record_http(url, response.status_code, len(response.content),
+                                    time.perf_counter() - started)
+                return response
+
+        return self.throttle.run(url, request)
+
+    def fetch_page(self, url):
+        """
+        Fetch a page, revalidating it against the cache
+        Returns (response, cached_rows); cached_rows is set when the page is unchanged
+        """
+        headers = self.cache.conditional_headers(url) if self.cache else {}
+        response = self._get(url, headers)
+
+        if response.status_code == 304 and self.cache:
+            cached = self.cache.lookup(url)
+            if cached is not None:
+                metrics.increment('cache_not_modified')
+                body, rows = cached
+                return None, rows if rows is not None else self.parse_page(body)
+            # Cache entry vanished between the request and now - fetch it again
+            response = self._get(url)
+
+        response.raise_for_status()
+        return response, None
+
+    def remember(self, url, response, rows):
+        """
+        Store a fresh response and its parsed rows in the cache
+        """
+        if self.cache and response is not None:
+            self.cache.store(
+                url,
+                response.content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                rows=rows,
+            )
+
     def scrape_tournament_data(self, url):
         """
         Scrape tournament data from a given URL
+        Unchanged pages (HTTP 304) are served from the cache without re-parsing
         """
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Add your scraping logic here
-            data = []
-            
+            response, data = self.fetch_page(url)
+            if data is not None:
+                return data
+
+            data = self.parse_page(response.content)
+            self.remember(url, response, data)
+
             return data
         
         except Exception as e:
+            metrics.increment('scrape_errors')
             print(f"Error scraping {url}: {e}")
             return []
-    
+
+    def parse_page(self, content):
+        """
+        Extract tournament rows from a page body
+        """
+        with metrics.stage('parse'):
+            return parse_tournament_page(content, self.parser, self.fixture_tables_only)
+
+    def scrape_many(self, urls, max_workers=None):
+        """
+        Scrape several URLs concurrently, returning one result list per URL in input order
+        max_workers can only lower the constructor's value, which sized the connection pool
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+
+        workers = min(max_workers or self.max_workers, self.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.scrape_tournament_data, urls))
+        if self.cache:
+            self.cache.flush()
+        return results
+
     def save_data(self, data, filename):
         """
         Save scraped data to CSV file
         """
         if data:
+            import pandas as pd
             df = pd.DataFrame(data)
             output_path = os.path.join('output', filename)
             df.to_csv(output_path, index=False)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo tournament simulator
+Replays the group stage and knockout bracket of a tournament many times with a
+Poisson score model fitted to the fixture results, and reports per-team
+probabilities of advancing from the group, reaching each round and winning.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+# Knockout rounds named by the number of teams still in the bracket; larger
+# rounds are called round_of_<n>
+ROUND_NAMES = {16: 'round_of_16', 8: 'quarter_final', 4: 'semi_final', 2: 'final', 1: 'champion'}
+
+# Runs simulated per vectorized chunk, which bounds worker memory
+CHUNK_RUNS = 50000
+
+
+def build_model(matches, shrinkage=2.0):
+    """
+    Build the score model and group structure from a tournament's matches
+    Attack/defence strengths are goals per match relative to the tournament
+    average, shrunk towards 1.0 by `shrinkage` pseudo-matches
+    """
+    teams = sorted({m['home_team'] for m in matches} | {m['away_team'] for m in matches})
+    team_ids = {team: i for i, team in enumerate(teams)}
+    n_teams = len(teams)
+
+    scored = np.zeros(n_teams)
+    conceded = np.zeros(n_teams)
+    played = np.zeros(n_teams)
+    groups = {}
+    for m in matches:
+        home, away = team_ids[m['home_team']], team_ids[m['away_team']]
+        scored[home] += m['home_score']
+        scored[away] += m['away_score']
+        conceded[home] += m['away_score']
+        conceded[away] += m['home_score']
+        played[[home, away]] += 1
+        if m['stage'].startswith('Group'):
+            groups.setdefault(m['stage'], []).append((home, away))
+
+    base_rate = scored.sum() / played.sum()
+    attack = (scored + shrinkage * base_rate) / ((played + shrinkage) * base_rate)
+    defence = (conceded + shrinkage * base_rate) / ((played + shrinkage) * base_rate)
+
+    group_names = sorted(groups)
+    group_teams = [sorted({t for pair in groups[g] for t in pair}) for g in group_names]
+    sizes = {len(t) for t in group_teams}
+    if len(sizes) != 1:
+        raise ValueError("All groups must have the same number of teams")
+
+    # Top two of each group go through, topped up with the best third-placed teams
+    bracket_size = 1
+    while bracket_size < 2 * len(group_names):
+        bracket_size *= 2
+    best_thirds = bracket_size - 2 * len(group_names)
+    if best_thirds > len(group_names):
+        raise ValueError("Not enough third-placed teams to fill the bracket")
+
+    return {
+        'teams': teams,
+        'team_group': {t: g for g, ts in zip(group_names, group_teams) for t in ts},
+        'attack': attack,
+        'defence': defence,
+        'base_rate': base_rate,
+        'group_teams': [np.array(ts) for ts in group_teams],
+        # Fixtures in group-local positions
+        'group_fixtures': [
+            np.array([(ts.index(h), ts.index(a)) for h, a in groups[g]])
+            for g, ts in zip(group_names, group_teams)
+        ],
+        'best_thirds': best_thirds,
+        'bracket_size': bracket_size,
+    }
+
+
+def round_name(teams_left):
+    return ROUND_NAMES.get(teams_left, f'round_of_{teams_left}')
+
+
+def _play(rng, model, home, away):
+    """Goals for two aligned arrays of team ids"""
+    rate = model['base_rate']
+    home_goals = rng.poisson(rate * model['attack'][home] * model['defence'][away])
+    away_goals = rng.poisson(rate * model['attack'][away] * model['defence'][home])
+    return home_goals, away_goals
+
+
+def _play_knockout(rng, model, home, away):
+    """Winners of knockout ties: extra time at a third of the rate, then penalties"""
+    home_goals, away_goals = _play(rng, model, home, away)
+    level = home_goals == away_goals
+    if level.any():
+        rate = model['base_rate'] / 3.0
+        h, a = home[level], away[level]
+        home_goals[level] += rng.poisson(rate * model['attack'][h] * model['defence'][a])
+        away_goals[level] += rng.poisson(rate * model['attack'][a] * model['defence'][h])
+        level = home_goals == away_goals
+        shootout = rng.random(len(home)) < 0.5
+        home_goals = home_goals + (level & shootout)
+        away_goals = away_goals + (level & ~shootout)
+    return np.where(home_goals > away_goals, home, away)
+
+
+def _play_group(rng, model, group, n_runs):
+    """Return (ranked team ids, ranking keys) for one group across all runs"""
+    team_ids = model['group_teams'][group]
+    size = len(team_ids)
+    points = np.zeros((n_runs, size), dtype=np.int64)
+    goals_for = np.zeros((n_runs, size), dtype=np.int64)
+    goals_against = np.zeros((n_runs, size), dtype=np.int64)
+
+    for home, away in model['group_fixtures'][group]:
+        home_goals, away_goals = _play(
+            rng, model,
+            np.full(n_runs, team_ids[home]), np.full(n_runs, team_ids[away])
+        )
+        goals_for[:, home] += home_goals
+        goals_for[:, away] += away_goals
+        goals_against[:, home] += away_goals
+        goals_against[:, away] += home_goals
+        points[:, home] += np.where(home_goals > away_goals, 3, home_goals == away_goals)
+        points[:, away] += np.where(away_goals > home_goals, 3, home_goals == away_goals)
+
+    # Points, then goal difference, then goals scored, then drawing of lots
+    key = (points * 1e6 + (goals_for - goals_against + 500) * 1e3 + goals_for
+           + rng.random((n_runs, size)))
+    order = np.argsort(-key, axis=1)
+    return team_ids[order], np.take_along_axis(key, order, axis=1)
+
+
+def _separate_group_mates(home_groups, away, away_groups):
+    """
+    Swap first-round opponents in place so no tie pairs two teams from the same group
+    Best thirds are drawn per run, so a fixed slot layout can put a group winner
+    against its own third; any clash that one swap of away teams can fix is fixed,
+    and the (rare) rest are left as drawn
+    """
+    width = away.shape[1]
+    for j in range(width):
+        for k in range(width):
+            if j == k:
+                continue
+            fix = ((away_groups[:, j] == home_groups[:, j])
+                   & (away_groups[:, k] != home_groups[:, j])
+                   & (away_groups[:, j] != home_groups[:, k]))
+            if fix.any():
+                away[fix, j], away[fix, k] = away[fix, k], away[fix, j]
+                away_groups[fix, j], away_groups[fix, k] = away_groups[fix, k], away_groups[fix, j]
+
+
+def _simulate_chunk(rng, model, n_runs, counts):
+    ranked = [_play_group(rng, model, g, n_runs) for g in range(len(model['group_teams']))]
+    winners = np.stack([teams[:, 0] for teams, _ in ranked], axis=1)
+    runners_up = np.stack([teams[:, 1] for teams, _ in ranked], axis=1)
+    slots = [winners, runners_up[:, ::-1]]
+
+    if model['best_thirds']:
+        thirds = np.stack([teams[:, 2] for teams, _ in ranked], axis=1)
+        third_keys = np.stack([keys[:, 2] for _, keys in ranked], axis=1)
+        best = np.argsort(-third_keys, axis=1)[:, :model['best_thirds']]
+        slots.append(np.take_along_axis(thirds, best, axis=1))
+
+    bracket = np.concatenate(slots, axis=1)
+    n_teams = len(model['teams'])
+    counts['advance_group'] += np.bincount(bracket.ravel(), minlength=n_teams)
+
+    # Group index of every bracket slot, to keep group-mates apart in the first round
+    n_groups = len(model['group_teams'])
+    slot_groups = [np.broadcast_to(np.arange(n_groups), (n_runs, n_groups)),
+                   np.broadcast_to(np.arange(n_groups)[::-1], (n_runs, n_groups))]
+    if model['best_thirds']:
+        slot_groups.append(best)
+    bracket_groups = np.concatenate(slot_groups, axis=1)
+
+    # First round pairs slot i with slot i + half, later rounds pair neighbours
+    half = bracket.shape[1] // 2
+    home, away = bracket[:, :half], bracket[:, half:].copy()
+    _separate_group_mates(bracket_groups[:, :half], away, bracket_groups[:, half:].copy())
+    while True:
+        name = round_name(2 * home.shape[1])
+        counts[name] += np.bincount(np.concatenate([home, away]).ravel(), minlength=n_teams)
+        winners = _play_knockout(rng, model, home.ravel(), away.ravel()).reshape(home.shape)
+        if winners.shape[1] == 1:
+            counts['champion'] += np.bincount(winners.ravel(), minlength=n_teams)
+            return
+        home, away = winners[:, 0::2], winners[:, 1::2]
+
+
+def _simulate_shard(model, n_runs, seed_seq):
+    """Simulate n_runs tournaments from one independent seed stream"""
+    rounds = []
+    teams_left = model['bracket_size']
+    while teams_left >= 1:
+        rounds.append(round_name(teams_left))
+        teams_left //= 2
+    counts = {name: np.zeros(len(model['teams']), dtype=np.int64)
+              for name in ['advance_group'] + rounds}
+    n_chunks = -(-n_runs // CHUNK_RUNS)
+    for chunk_seed, start in zip(seed_seq.spawn(n_chunks), range(0, n_runs, CHUNK_RUNS)):
+        rng = np.random.default_rng(chunk_seed)
+        _simulate_chunk(rng, model, min(CHUNK_RUNS, n_runs - start), counts)
+    return counts
+
+
+def simulate_tournament(matches, n_runs=100000, seed=None, workers=None):
+    """
+    Simulate a tournament n_runs times across a process pool
+    Results are deterministic for a given seed and worker count
+    """
+    model = build_model(matches)
+    workers = max(1, min(workers or os.cpu_count() or 1, n_runs))
+
+    shard_runs = [n_runs // workers + (i < n_runs % workers) for i in range(workers)]
+    shard_seeds = np.random.SeedSequence(seed).spawn(workers)
+
+    if workers == 1:
+        shards = [_simulate_shard(model, shard_runs[0], shard_seeds[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = list(pool.map(_simulate_shard, [model] * workers, shard_runs, shard_seeds))
+
+    totals = {name: sum(shard[name] for shard in shards) for name in shards[0]}
+    stage_names = [name for name in totals if totals[name].any()]
+
+    results = []
+    for team_id, team in enumerate(model['teams']):
+        row = {'team': team, 'group': model['team_group'].get(team_id)}
+        for name in stage_names:
+            row[f'p_{name}'] = round(float(totals[name][team_id]) / n_runs, 4)
+        results.append(row)
+
+    results.sort(key=lambda r: r['p_champion'], reverse=True)
+    return results
+
+
+if __name__ == "__main__":
+    from complete_tournament_with_cards_time import (
+        create_complete_euro_with_cards_time,
+        create_complete_wafcon_with_cards_time,
+    )
+
+    for tournament_name, matches in [('WAFCON 2024', create_complete_wafcon_with_cards_time()),
+                                     ('UEFA Euro 2025', create_complete_euro_with_cards_time())]:
+        print(f"\n🏆 {tournament_name} - title odds")
+        for row in simulate_tournament(matches, n_runs=100000, seed=2025):
+            print(f"  {row['team']:<14} group {row['p_advance_group']:.1%}  "
+                  f"final {row['p_final']:.1%}  title {row['p_champion']:.1%}")
@@ -0,0 +1,158 @@
+"""
+Incremental group standings
+Applying or correcting a result updates the two teams involved in O(1); the
+tiebreak ordering of a group is recomputed lazily, and only for groups that
+changed since their table was last read. Groups are keyed by (tournament, stage)
+so one engine can follow many competitions.
+"""
+
+# Fair-play deductions per card (fewer points ranks higher)
+FAIR_PLAY_POINTS = {'yellow': 1, 'red': 3}
+
+
+class TeamStanding:
+    """One row of a group table"""
+    __slots__ = ('team', 'tournament', 'group', 'played', 'won', 'drawn', 'lost', 'goals_for',
+                 'goals_against', 'yellow_cards', 'red_cards')
+
+    def __init__(self, team, tournament, group):
+        self.team = team
+        self.tournament = tournament
+        self.group = group
+        self.played = self.won = self.drawn = self.lost = 0
+        self.goals_for = self.goals_against = 0
+        self.yellow_cards = self.red_cards = 0
+
+    @property
+    def points(self):
+        return 3 * self.won + self.drawn
+
+    @property
+    def goal_difference(self):
+        return self.goals_for - self.goals_against
+
+    @property
+    def fair_play_points(self):
+        return (FAIR_PLAY_POINTS['yellow'] * self.yellow_cards
+                + FAIR_PLAY_POINTS['red'] * self.red_cards)
+
+    def sort_key(self):
+        # Points, goal difference, goals scored, fair play, then name for stability
+        return (-self.points, -self.goal_difference, -self.goals_for,
+                self.fair_play_points, self.team)
+
+    def _apply(self, scored, conceded, yellow_cards, red_cards, sign):
+        self.played += sign
+        self.goals_for += sign * scored
+        self.goals_against += sign * conceded
+        self.yellow_cards += sign * yellow_cards
+        self.red_cards += sign * red_cards
+        if scored > conceded:
+            self.won += sign
+        elif scored < conceded:
+            self.lost += sign
+        else:
+            self.drawn += sign
+
+    def to_dict(self):
+        return {
+            'tournament': self.tournament,
+            'group': self.group,
+            'team': self.team,
+            'played': self.played,
+            'won': self.won,
+            'drawn': self.drawn,
+            'lost': self.lost,
+            'goals_for': self.goals_for,
+            'goals_against': self.goals_against,
+            'goal_difference': self.goal_difference,
+            'points': self.points,
+            'yellow_cards': self.yellow_cards,
+            'red_cards': self.red_cards,
+            'fair_play_points': self.fair_play_points,
+        }
+
+
+def _contribution(match):
+    """
+    What one group match adds to the table
+    Cards use per-team fields when the data has them (home_yellow_cards, ...);
+    otherwise the match totals count against both teams
+    """
+    cards = {}
+    for side in ('home', 'away'):
+        cards[side] = (match.get(f'{side}_yellow_cards', match['yellow_cards']),
+                       match.get(f'{side}_red_cards', match['red_cards']))
+    return ((match.get('tournament'), match['stage']), match['home_team'], match['away_team'],
+            match['home_score'], match['away_score'], cards['home'], cards['away'])
+
+
+class StandingsEngine:
+    """Group tables kept up to date one result at a time"""
+
+    def __init__(self, matches=()):
+        self._groups = {}
+        self._applied = {}
+        self._ordered = {}
+        for match in matches:
+            self.apply_result(match)
+
+    def _standing(self, group, team):
+        table = self._groups.setdefault(group, {})
+        standing = table.get(team)
+        if standing is None:
+            standing = table[team] = TeamStanding(team, *group)
+        return standing
+
+    def _apply(self, contribution, sign):
+        group, home, away, home_score, away_score, home_cards, away_cards = contribution
+        self._standing(group, home)._apply(home_score, away_score, *home_cards, sign)
+        self._standing(group, away)._apply(away_score, home_score, *away_cards, sign)
+        self._ordered.pop(group, None)
+
+    def apply_result(self, match):
+        """
+        Apply a new or corrected group-stage result; returns False for other stages
+        A match_id that was applied before is first backed out, so corrections
+        simply re-send the match
+        """
+        match_id = match['match_id']
+        previous = self._applied.pop(match_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+
+        if not match['stage'].startswith('Group'):
+            return False
+
+        contribution = _contribution(match)
+        self._apply(contribution, +1)
+        self._applied[match_id] = contribution
+        return True
+
+    def remove_result(self, match_id):
+        """Back out a previously applied result (e.g. an annulled match)"""
+        previous = self._applied.pop(match_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+
+    def groups(self):
+        """(tournament, group) pairs with at least one result"""
+        return sorted(self._groups, key=lambda key: (key[0] or '', key[1]))
+
+    def table(self, tournament, group):
+        """TeamStanding rows of one group in ranking order"""
+        key = (tournament, group)
+        ordered = self._ordered.get(key)
+        if ordered is None:
+            ordered = sorted(self._groups.get(key, {}).values(), key=TeamStanding.sort_key)
+            self._ordered[key] = ordered
+        return ordered
+
+    def tables(self):
+        """Every group table as a list of row dicts, keyed by tournament then group"""
+        tables = {}
+        for tournament, group in self.groups():
+            tables.setdefault(tournament, {})[group] = [
+                row.to_dict() for row in self.table(tournament, group)
+            ]
+        return tables
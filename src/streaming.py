@@ -0,0 +1,208 @@
+"""
+Streaming enrichment and output
+Matches flow from the fixture registry through enrichment as a generator and
+are written incrementally to NDJSON and chunked CSV files, so the full dataset
+is never held in memory. Matching readers stream the files back.
+"""
+import csv
+from contextlib import ExitStack
+from itertools import islice
+import json
+import os
+
+import numpy as np
+
+import metrics
+from aggregation import (CARDS_ANALYSIS_FIELDS, SUMMARY_FIELDS, TIME_ANALYSIS_FIELDS,
+                         TournamentAggregator)
+from complete_tournament_with_cards_time import OUTPUT_DIR, enrich_matches, tournament_seeds
+from incremental_export import ExportManifest, atomic_open
+from match_store import MATCH_FIELDS, convert_csv_row
+from tournament_registry import REGISTRY
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def iter_enriched_matches(tournaments=None, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield enriched matches one at a time, tournament by tournament
+    Each tournament is enriched chunk_size fixtures at a time from its own
+    random stream; with chunk_size >= the tournament size the values match
+    export_complete_enhanced_data for the same seed
+    """
+    seeds = tournament_seeds(seed)
+    for name in tournaments or REGISTRY.names():
+        entry = REGISTRY.get(name)
+        rng = np.random.default_rng(seeds[entry['tournament']])
+        # Fixtures are decoded from the data file as they are needed, never cached
+        fixtures = REGISTRY.iter_fixtures(name)
+        start = 0
+        while True:
+            chunk = list(islice(fixtures, chunk_size))
+            if not chunk:
+                break
+            yield from enrich_matches(
+                chunk, entry['tournament'], entry['id_prefix'],
+                entry['week_anchor_day'], seed=rng, start_index=start
+            )
+            start += len(chunk)
+
+class NDJSONWriter:
+    """Writes one JSON object per line; the file appears atomically on close"""
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._context = atomic_open(path)
+        self._file = None
+
+    def __enter__(self):
+        self._file = self._context.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        result = self._context.__exit__(*exc_info)
+        if exc_info[0] is None:
+            metrics.record_write(os.path.basename(self.path), self.rows, os.path.getsize(self.path))
+        return result
+
+    def writerow(self, row):
+        self._file.write(json.dumps(row))
+        self._file.write('\n')
+        self.rows += 1
+
+
+class ChunkedCSVWriter:
+    """
+    csv.DictWriter that buffers rows and writes them chunk_size at a time
+    Columns are fixed up front, so rows may omit optional fields
+    """
+
+    def __init__(self, path, fieldnames, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.fieldnames = fieldnames
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._context = atomic_open(path, newline='')
+        self._buffer = []
+        self._writer = None
+
+    def __enter__(self):
+        f = self._context.__enter__()
+        self._writer = csv.DictWriter(f, fieldnames=self.fieldnames, lineterminator='\n',
+                                      extrasaction='ignore')
+        self._writer.writeheader()
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.flush()
+        result = self._context.__exit__(*exc_info)
+        if exc_info[0] is None:
+            metrics.record_write(os.path.basename(self.path), self.rows, os.path.getsize(self.path))
+        return result
+
+    def writerow(self, row):
+        self._buffer.append(row)
+        self.rows += 1
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self._buffer.clear()
+
+
+def read_ndjson(path):
+    """Yield the objects of an NDJSON file one at a time"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv_matches(path):
+    """Yield match dicts from an exported CSV, with numeric and boolean fields restored"""
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield convert_csv_row(row)
+
+
+def export_streaming(tournaments=None, seed=None, output_dir=OUTPUT_DIR,
+                     chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Export enhanced data in one streaming pass
+    Writes per-tournament and combined NDJSON + CSV, the time and cards analysis
+    CSVs and the summary statistics; memory stays flat in the number of matches.
+    Combined files are only written when every registry tournament is selected.
+    Files shared with the CSV export are dropped from its manifest, so the next
+    CSV run rebuilds them. Returns the summary statistics rows.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    names = tournaments or REGISTRY.names()
+    include_combined = {REGISTRY.get(name)['tournament'] for name in names} == set(REGISTRY.names())
+    written = []
+
+    def path(name):
+        written.append(name)
+        return os.path.join(output_dir, name)
+
+    try:
+        with metrics.stage('stream_export'), ExitStack() as stack:
+            combined = []
+            time_csv = cards_csv = None
+            if include_combined:
+                combined = [
+                    stack.enter_context(NDJSONWriter(path('BOTH_TOURNAMENTS_COMPLETE_ENHANCED.ndjson'))),
+                    stack.enter_context(ChunkedCSVWriter(path('BOTH_TOURNAMENTS_COMPLETE_ENHANCED.csv'),
+                                                         MATCH_FIELDS, chunk_size)),
+                ]
+                time_csv = stack.enter_context(ChunkedCSVWriter(
+                    path('MATCH_TIME_ANALYSIS.csv'), TIME_ANALYSIS_FIELDS, chunk_size))
+                cards_csv = stack.enter_context(ChunkedCSVWriter(
+                    path('CARDS_ANALYSIS.csv'), CARDS_ANALYSIS_FIELDS, chunk_size))
+
+            aggregator = TournamentAggregator(time_csv, cards_csv)
+            current, tournament_json, tournament_csv = None, None, None
+            try:
+                for match in iter_enriched_matches(names, seed, chunk_size):
+                    # Matches arrive grouped by tournament: swap per-tournament files on change
+                    if match['tournament'] != current:
+                        if current is not None:
+                            tournament_json.__exit__(None, None, None)
+                            tournament_csv.__exit__(None, None, None)
+                        current = match['tournament']
+                        prefix = REGISTRY.get(current)['id_prefix']
+                        tournament_json = NDJSONWriter(
+                            path(f'{prefix}_COMPLETE_ENHANCED.ndjson')).__enter__()
+                        tournament_csv = ChunkedCSVWriter(
+                            path(f'{prefix}_COMPLETE_WITH_CARDS_TIME.csv'), MATCH_FIELDS,
+                            chunk_size).__enter__()
+
+                    tournament_json.writerow(match)
+                    tournament_csv.writerow(match)
+                    for writer in combined:
+                        writer.writerow(match)
+                    aggregator.add(match)
+            except BaseException as e:
+                if current is not None:
+                    tournament_json.__exit__(type(e), e, e.__traceback__)
+                    tournament_csv.__exit__(type(e), e, e.__traceback__)
+                raise
+            if current is not None:
+                tournament_json.__exit__(None, None, None)
+                tournament_csv.__exit__(None, None, None)
+
+        summary_stats = aggregator.summary_rows()
+        if include_combined:
+            with ChunkedCSVWriter(path('TOURNAMENT_SUMMARY_STATISTICS.csv'), SUMMARY_FIELDS) as summary:
+                for row in summary_stats:
+                    summary.writerow(row)
+    finally:
+        # Even a failed run may already have replaced some files
+        manifest = ExportManifest(output_dir)
+        for name in written:
+            manifest.forget(name)
+        manifest.save()
+    return summary_stats
@@ -0,0 +1,97 @@
+"""
+Declarative registry of tournament fixtures
+fixtures/index.json lists the competitions; each competition's matches live in
+their own data file, which is only read the first time that tournament is used.
+"""
+import json
+import os
+import threading
+
+_decoder = json.JSONDecoder()
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class TournamentRegistry:
+    """Looks up tournaments by name and loads their fixtures lazily"""
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR):
+        self.fixtures_dir = fixtures_dir
+        self._lock = threading.Lock()
+        self._index = None
+        self._fixtures = {}
+
+    def _entries(self):
+        if self._index is None:
+            with open(os.path.join(self.fixtures_dir, 'index.json'), encoding='utf-8') as f:
+                self._index = json.load(f)
+        return self._index
+
+    def names(self):
+        """Tournament names in registry order"""
+        return [entry['tournament'] for entry in self._entries()]
+
+    def get(self, name):
+        """Registry entry for a tournament name or id prefix (case-insensitive)"""
+        wanted = name.strip().lower()
+        for entry in self._entries():
+            if wanted in (entry['tournament'].lower(), entry['id_prefix'].lower()):
+                return entry
+        raise KeyError(f"Unknown tournament: {name} (available: {', '.join(self.names())})")
+
+    def fixtures(self, name):
+        """Raw fixture dicts for a tournament, read from disk on first access"""
+        entry = self.get(name)
+        key = entry['tournament']
+        with self._lock:
+            if key not in self._fixtures:
+                path = os.path.join(self.fixtures_dir, entry['file'])
+                with open(path, encoding='utf-8') as f:
+                    self._fixtures[key] = json.load(f)
+        # Callers enrich matches in place, so hand out copies of the cached fixtures
+        return [dict(match) for match in self._fixtures[key]]
+
+    def iter_fixtures(self, name, read_size=64 * 1024):
+        """
+        Yield a tournament's fixture dicts straight from its data file
+        Nothing is cached and only one read buffer is held, so memory does not
+        grow with the size of the file
+        """
+        entry = self.get(name)
+        with open(os.path.join(self.fixtures_dir, entry['file']), encoding='utf-8') as f:
+            yield from _iter_json_array(f, read_size)
+
+
+def _iter_json_array(f, read_size):
+    """Incrementally decode a top-level JSON array of objects from a text file"""
+    buffer = ''
+    position = 0
+    started = eof = False
+    while True:
+        # Skip whitespace, the opening bracket and separators between elements
+        while position < len(buffer) and (buffer[position].isspace() or buffer[position] in ',['):
+            started = started or buffer[position] == '['
+            position += 1
+
+        if position < len(buffer):
+            if started and buffer[position] == ']':
+                return
+            try:
+                item, position = _decoder.raw_decode(buffer, position)
+            except ValueError:
+                # Most likely an element cut off by the end of the buffer
+                if eof:
+                    raise
+            else:
+                yield item
+                continue
+        elif eof:
+            raise ValueError(f"Unterminated JSON array in {getattr(f, 'name', 'fixture file')}")
+
+        chunk = f.read(read_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+REGISTRY = TournamentRegistry()